@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0002_testimony_is_public'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='prayerrequest',
+            name='is_prayed_for',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='testimony',
+            name='is_approved',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+    ]
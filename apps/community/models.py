@@ -14,7 +14,7 @@ class PrayerRequest(TimeStampedModel):
     email = models.EmailField(blank=True)
     request = models.TextField()
     is_public = models.BooleanField(default=False)
-    is_prayed_for = models.BooleanField(default=False)
+    is_prayed_for = models.BooleanField(default=False, db_index=True)
 
     def __str__(self):
         return self.request[:50]
@@ -31,7 +31,7 @@ class Testimony(TimeStampedModel):
     name = models.CharField(max_length=150, blank=True)
     country = models.CharField(max_length=100, blank=True)
     testimony = models.TextField()
-    is_approved = models.BooleanField(default=False)
+    is_approved = models.BooleanField(default=False, db_index=True)
     featured = models.BooleanField(default=False)
     is_public = models.BooleanField(
         default=True,
@@ -0,0 +1,26 @@
+"""
+Shared pagination helpers.
+"""
+import hashlib
+
+from django.core.cache import caches
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches the total row count for a short time.
+    Every page of a paginated ListView otherwise runs a COUNT(*) over the whole filtered
+    queryset; the count is keyed by the queryset's SQL, so each filter/search combination
+    shares one cached count across pages and visitors (per process, in the 'local' cache).
+    """
+    COUNT_CACHE_TIMEOUT = 60
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return super().count
+        key = 'paginator_count:' + hashlib.md5(str(query).encode()).hexdigest()
+        return caches['local'].get_or_set(key, lambda: Paginator.count.func(self), self.COUNT_CACHE_TIMEOUT)
@@ -0,0 +1,16 @@
+"""
+Shared slug helpers.
+"""
+from functools import lru_cache
+
+from django.utils.text import slugify
+
+
+@lru_cache(maxsize=4096)
+def fast_slugify(value):
+    """
+    Memoized slugify() for model slug defaults.
+    Imports often repeat the same names/titles, and slugify() does a full Unicode
+    normalisation pass on every call, so repeated values are served from the cache.
+    """
+    return slugify(value)
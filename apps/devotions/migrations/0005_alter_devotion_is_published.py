@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devotions', '0004_devotionseries_banner_image'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='devotion',
+            name='is_published',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+    ]
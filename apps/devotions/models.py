@@ -30,7 +30,9 @@ class DevotionSeries(TimeStampedModel):
         return self.title
 
     def save(self, *args, **kwargs):
-        if not self.slug:
+        # Partial saves that don't write the slug (e.g. counter updates) skip generating it
+        update_fields = kwargs.get('update_fields')
+        if not self.slug and (update_fields is None or 'slug' in update_fields):
             self.slug = slugify(self.title)
         super().save(*args, **kwargs)
 
@@ -59,7 +61,7 @@ class Devotion(TimeStampedModel):
     prayer = models.TextField(blank=True, help_text="Today's Prayer")
     action_point = models.TextField(blank=True, help_text="Action point or practical application")
     publish_date = models.DateField(db_index=True)
-    is_published = models.BooleanField(default=False)
+    is_published = models.BooleanField(default=False, db_index=True)
     image = models.ImageField(upload_to="devotions/images/", blank=True, null=True, help_text="Featured image for this devotion")
     audio_file = models.FileField(upload_to="devotions/audio/", blank=True, null=True)
     pdf_file = models.FileField(upload_to="devotions/pdf/", blank=True, null=True)
@@ -73,7 +75,8 @@ class Devotion(TimeStampedModel):
         return self.title
 
     def save(self, *args, **kwargs):
-        if not self.slug:
+        update_fields = kwargs.get('update_fields')
+        if not self.slug and (update_fields is None or 'slug' in update_fields):
             self.slug = slugify(self.title)
         super().save(*args, **kwargs)
 
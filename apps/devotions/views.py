@@ -143,7 +143,7 @@ class TodayDevotionView(DetailView):
 
         context["is_live_time"] = is_live_time
         # Uplift Your Morning: no Zoom; show YouTube + Facebook live only during 5:00–5:30 AM
-        site_settings, _ = SiteSettings.objects.get_or_create(pk=1)
+        site_settings = SiteSettings.get_cached()
         context["uplift_morning_facebook_url"] = site_settings.uplift_morning_facebook_url or ""
 
         return context
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_event_facebook_url_event_poster_image_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='event',
+            name='start_datetime',
+            field=models.DateTimeField(db_index=True),
+        ),
+    ]
@@ -13,7 +13,7 @@ class Event(TimeStampedModel):
     title = models.CharField(max_length=200)
     slug = models.SlugField(unique=True)
     description = models.TextField()
-    start_datetime = models.DateTimeField()
+    start_datetime = models.DateTimeField(db_index=True)
     end_datetime = models.DateTimeField()
     location = models.CharField(max_length=255, blank=True)
     is_online = models.BooleanField(default=False)
@@ -47,7 +47,9 @@ class Event(TimeStampedModel):
         return self.title
 
     def save(self, *args, **kwargs):
-        if not self.slug:
+        # Partial saves that don't write the slug (e.g. counter updates) skip generating it
+        update_fields = kwargs.get('update_fields')
+        if not self.slug and (update_fields is None or 'slug' in update_fields):
             self.slug = slugify(self.title)
         super().save(*args, **kwargs)
 
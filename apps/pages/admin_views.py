@@ -864,7 +864,8 @@ class DonationListView(StaffRequiredMixin, ListView):
     paginate_by = 20
 
     def get_queryset(self):
-        queryset = Donation.objects.all()
+        # The list never shows the Paystack payload, so leave raw_response out
+        queryset = Donation.objects.defer('raw_response')
         # Filter by status
         status = self.request.GET.get('status')
         if status:
@@ -1389,20 +1390,21 @@ class PledgeFindDuplicatesView(StaffRequiredMixin, View):
         duplicate_groups = defaultdict(list)
         
         for dup in email_duplicates:
-            pledges = Pledge.objects.filter(email=dup['email']).order_by('created_at')
-            if pledges.count() > 1:
-                duplicate_groups[dup['email']] = list(pledges)
+            # Evaluate once; len() on the list avoids a separate COUNT query
+            pledges = list(Pledge.objects.filter(email=dup['email']).order_by('created_at'))
+            if len(pledges) > 1:
+                duplicate_groups[dup['email']] = pledges
         
         # Also check name+email combinations
         for dup in name_email_duplicates:
             key = f"{dup['full_name']}|{dup['email']}"
             if key not in duplicate_groups:
-                pledges = Pledge.objects.filter(
+                pledges = list(Pledge.objects.filter(
                     full_name=dup['full_name'],
                     email=dup['email']
-                ).order_by('created_at')
-                if pledges.count() > 1:
-                    duplicate_groups[key] = list(pledges)
+                ).order_by('created_at'))
+                if len(pledges) > 1:
+                    duplicate_groups[key] = pledges
         
         # Convert to list of dicts for better template handling
         duplicate_groups_list = []
@@ -1860,9 +1862,7 @@ class SiteSettingsUpdateView(StaffRequiredMixin, UpdateView):
     success_url = reverse_lazy('manage:sitesettings_edit')
 
     def get_object(self, queryset=None):
-        # Get or create the singleton instance
-        obj, created = SiteSettings.objects.get_or_create(pk=1)
-        return obj
+        return SiteSettings.load()
 
     def form_valid(self, form):
         messages.success(self.request, 'Site settings updated successfully!')
@@ -3,9 +3,12 @@ Middleware to track page views for analytics.
 Optimized with rate limiting and caching to prevent performance issues.
 """
 from django.utils.deprecation import MiddlewareMixin
-from django.core.cache import cache
+from django.core.cache import caches
 from django.conf import settings
 import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
 
 # Lazy import to avoid issues during Django startup
 try:
@@ -76,9 +79,12 @@ class AnalyticsMiddleware(MiddlewareMixin):
         # Rate limiting: Check if we've tracked this IP+path recently
         ip_address = self.get_client_ip(request)
         cache_key = self._get_cache_key(ip_address, path)
+        # Per-process cache: rate-limit keys are written on every tracked request and
+        # would churn the shared file cache
+        rate_limit_cache = caches['local']
         
         # Check cache - if exists, skip tracking (already tracked recently)
-        if cache.get(cache_key):
+        if rate_limit_cache.get(cache_key):
             return response
         
         # Get page name from mapping or use path
@@ -90,13 +96,14 @@ class AnalyticsMiddleware(MiddlewareMixin):
         # Get referer
         referer = request.META.get('HTTP_REFERER', '')
         
-        # Create page view record asynchronously (non-blocking)
-        # Use a try-except to ensure it never blocks the response
+        # Record the page view in the request (rate-limited above, so at most one INSERT
+        # per IP+path every RATE_LIMIT_SECONDS); PageView.save() stamps the day and
+        # updates the PageViewDaily rollup
+        # Use a try-except so a failed write never breaks the response
         try:
             # Set cache to prevent duplicate tracking for RATE_LIMIT_SECONDS
-            cache.set(cache_key, True, self.RATE_LIMIT_SECONDS)
+            rate_limit_cache.set(cache_key, True, self.RATE_LIMIT_SECONDS)
             
-            # Create the record (this is still synchronous but rate-limited)
             PageView.objects.create(
                 path=path,
                 page_name=page_name,
@@ -104,11 +111,10 @@ class AnalyticsMiddleware(MiddlewareMixin):
                 user_agent=user_agent[:500],  # Limit length
                 referer=referer[:500] if referer else '',  # Limit length
             )
-        except Exception:
-            # Silently fail if there's any error (don't break the site)
-            # Remove cache key if creation failed so it can retry
-            cache.delete(cache_key)
-            pass
+        except Exception as e:
+            # Don't break the site; log the failure and remove the cache key so it can retry
+            logger.error(f"Failed to record page view for {path}: {e}")
+            rate_limit_cache.delete(cache_key)
         
         return response
     
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0016_sitesettings_uplift_morning_facebook_url'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='coordinatorapplication',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('contacted', 'Contacted'), ('interviewed', 'Interviewed'), ('accepted', 'Accepted'), ('declined', 'Declined')], db_index=True, default='pending', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='counselingbooking',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending Approval'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], db_index=True, default='pending', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='donation',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('success', 'Successful'), ('failed', 'Failed')], db_index=True, default='pending', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='question',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('answered', 'Answered')], db_index=True, default='pending', max_length=20),
+        ),
+    ]
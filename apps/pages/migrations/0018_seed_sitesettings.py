@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8
+
+from django.db import migrations
+
+
+def seed_site_settings(apps, schema_editor):
+    SiteSettings = apps.get_model('pages', 'SiteSettings')
+    SiteSettings.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0017_status_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_site_settings, migrations.RunPython.noop),
+    ]
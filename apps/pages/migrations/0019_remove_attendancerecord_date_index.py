@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0018_seed_sitesettings'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='attendancerecord',
+            name='pages_atten_date_a7de68_idx',
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.8
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def build_daily_counts(apps, schema_editor):
+    PageView = apps.get_model('pages', 'PageView')
+    PageViewDaily = apps.get_model('pages', 'PageViewDaily')
+    PageView.objects.filter(day__isnull=True).update(day=TruncDate('created_at'))
+    rows = PageView.objects.values('day', 'path', 'page_name').annotate(count=Count('*')).order_by()
+    PageViewDaily.objects.bulk_create(
+        (PageViewDaily(**row) for row in rows.iterator(chunk_size=2000)),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0019_remove_attendancerecord_date_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pageview',
+            name='day',
+            field=models.DateField(blank=True, editable=False, help_text='Local date of the visit, used for the PageViewDaily rollup', null=True),
+        ),
+        migrations.CreateModel(
+            name='PageViewDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('path', models.CharField(max_length=500)),
+                ('page_name', models.CharField(blank=True, max_length=200)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Daily Page Views',
+                'verbose_name_plural': 'Daily Page Views',
+                'ordering': ['-day', '-count'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'path', 'page_name'), name='pv_daily_unique')],
+            },
+        ),
+        migrations.RunPython(build_daily_counts, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,12 @@
 """
 Models for static pages like Home, About, Contact, etc.
 """
+import uuid
+
+from django.core.cache import cache
 from django.db import models
+from django.db.models import F
+from django.utils import timezone
 from apps.core.models import TimeStampedModel
 
 
@@ -48,6 +53,7 @@ class Donation(TimeStampedModel):
         max_length=20,
         choices=STATUS_CHOICES,
         default=STATUS_PENDING,
+        db_index=True,
     )
     note = models.CharField(max_length=255, blank=True)
     raw_response = models.JSONField(blank=True, null=True)
@@ -73,13 +79,30 @@ class SiteSettings(TimeStampedModel):
         help_text="Facebook live URL for Uplift Your Morning (5:00–5:30 AM). Shown every morning during the live window."
     )
     
+    CACHE_KEY = 'site_settings_v1'
+    CACHE_TIMEOUT = 3600
+
     def __str__(self):
         return "Site Settings"
     
+    @classmethod
+    def load(cls):
+        """Return the singleton row; it is seeded by migration, so creating is only a fallback."""
+        try:
+            return cls.objects.get(pk=1)
+        except cls.DoesNotExist:
+            return cls.objects.get_or_create(pk=1)[0]
+    
+    @classmethod
+    def get_cached(cls):
+        """Return the singleton, served from the cache (refreshed on save)."""
+        return cache.get_or_set(cls.CACHE_KEY, cls.load, cls.CACHE_TIMEOUT)
+    
     def save(self, *args, **kwargs):
         # Ensure only one instance exists
         self.pk = 1
         super().save(*args, **kwargs)
+        cache.delete(self.CACHE_KEY)
     
     def delete(self, *args, **kwargs):
         # Prevent deletion - just clear the fields instead
@@ -137,7 +160,8 @@ class CounselingBooking(TimeStampedModel):
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
-        default=STATUS_PENDING
+        default=STATUS_PENDING,
+        db_index=True,
     )
     approved_date = models.DateField(null=True, blank=True, help_text="Admin-approved date")
     approved_time = models.TimeField(null=True, blank=True, help_text="Admin-approved time")
@@ -202,6 +226,7 @@ class Question(TimeStampedModel):
         max_length=20,
         choices=STATUS_CHOICES,
         default=STATUS_PENDING,
+        db_index=True,
     )
 
     class Meta:
@@ -274,6 +299,7 @@ class CoordinatorApplication(TimeStampedModel):
         max_length=20,
         choices=STATUS_CHOICES,
         default=STATUS_PENDING,
+        db_index=True,
     )
     admin_notes = models.TextField(blank=True)
 
@@ -332,9 +358,48 @@ class FortyDaysConfig(TimeStampedModel):
         help_text="Set to False to disable this configuration (useful for past years)"
     )
     
+    # Cleared on save/delete in every worker (shared cache); the short timeouts bound
+    # staleness from writes that skip signals, such as queryset.update()
+    ACTIVE_CACHE_KEY = 'forty_days_config_active_v1'
+    ACTIVE_CACHE_TIMEOUT = 60
+    YEAR_RANGES_CACHE_KEY = 'forty_days_year_ranges_v1'
+    YEAR_RANGES_CACHE_TIMEOUT = 300
+    
     def __str__(self):
         return f"40 Days {self.start_date.year} ({self.start_date} to {self.end_date})"
     
+    @classmethod
+    def get_active_cached(cls):
+        """
+        Return the active configuration (or None), served from the cache.
+        Only the date range and the live/banner fields used by the home page are loaded;
+        the cache is cleared whenever a configuration is saved or deleted (see signals.py).
+        """
+        def load():
+            return cls.objects.filter(is_active=True).only(
+                'id', 'start_date', 'end_date', 'banner_image',
+                'morning_youtube_url', 'morning_facebook_url',
+                'evening_youtube_url', 'evening_facebook_url',
+            ).first()
+        return cache.get_or_set(cls.ACTIVE_CACHE_KEY, load, cls.ACTIVE_CACHE_TIMEOUT)
+    
+    @classmethod
+    def get_year_ranges(cls):
+        """
+        Return {year: (start_date, end_date)} for the configuration that applies to each year:
+        the active one if there is one, otherwise the latest. Used to label 40 Days notes;
+        served from the cache and cleared whenever a configuration changes (see signals.py).
+        """
+        def load():
+            ranges = {}
+            # Later rows overwrite earlier ones: active configs come last, latest start date last
+            for start_date, end_date in cls.objects.order_by('is_active', 'start_date').values_list(
+                'start_date', 'end_date'
+            ):
+                ranges[start_date.year] = (start_date, end_date)
+            return ranges
+        return cache.get_or_set(cls.YEAR_RANGES_CACHE_KEY, load, cls.YEAR_RANGES_CACHE_TIMEOUT)
+    
     class Meta:
         ordering = ['-start_date']
         verbose_name = "40 Days Configuration"
@@ -368,10 +433,25 @@ class PageView(TimeStampedModel):
         blank=True,
         help_text="The page the user came from (if available)"
     )
+    day = models.DateField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Local date of the visit, used for the PageViewDaily rollup"
+    )
     
     def __str__(self):
         return f"{self.page_name or self.path} - {self.created_at.strftime('%Y-%m-%d %H:%M')}"
     
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        if self.day is None:
+            self.day = timezone.localdate(self.created_at) if self.created_at else timezone.localdate()
+        super().save(*args, **kwargs)
+        if adding:
+            # Keep the per-day rollup the dashboard reads from in step
+            PageViewDaily.increment(self.day, self.path, self.page_name)
+    
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Page View"
@@ -382,6 +462,40 @@ class PageView(TimeStampedModel):
         ]
 
 
+class PageViewDaily(models.Model):
+    """
+    Page view counts per day and page, rolled up from PageView as views are recorded.
+    The dashboard reads all of its analytics (totals, most viewed pages, the chart)
+    from here instead of grouping the raw views.
+    """
+    day = models.DateField()
+    path = models.CharField(max_length=500)
+    page_name = models.CharField(max_length=200, blank=True)
+    count = models.PositiveIntegerField(default=0)
+    
+    def __str__(self):
+        return f"{self.day} {self.path}: {self.count} views"
+    
+    @classmethod
+    def increment(cls, day, path, page_name=''):
+        """Add a view to the given day and page, creating its row on the first view."""
+        rows = cls.objects.filter(day=day, path=path, page_name=page_name)
+        if rows.update(count=F('count') + 1):
+            return
+        _, created = cls.objects.get_or_create(day=day, path=path, page_name=page_name, defaults={'count': 1})
+        if not created:
+            # Another request created the row first
+            rows.update(count=F('count') + 1)
+    
+    class Meta:
+        ordering = ['-day', '-count']
+        verbose_name = "Daily Page Views"
+        verbose_name_plural = "Daily Page Views"
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'path', 'page_name'], name='pv_daily_unique'),
+        ]
+
+
 class Pledge(TimeStampedModel):
     """
     Model for collecting pledge commitments from supporters.
@@ -781,9 +895,30 @@ class AttendanceRecord(TimeStampedModel):
         help_text="Any additional notes about this day's attendance"
     )
     
+    ANALYTICS_CACHE_VERSION_KEY = 'attendance_analytics_version'
+    
     def __str__(self):
         return f"Attendance - {self.date.strftime('%Y-%m-%d')}"
     
+    @classmethod
+    def get_analytics_cache_version(cls):
+        """Current version for the cached analytics; replaced whenever a record changes."""
+        version = cache.get(cls.ANALYTICS_CACHE_VERSION_KEY)
+        if version is None:
+            # add() only writes if the key is still missing, then every worker re-reads
+            # whatever was stored. The file cache can't make that atomic across workers, so
+            # two may briefly use different tokens; they converge on the next read and the
+            # worst case is one extra recomputation of the analytics
+            cache.add(cls.ANALYTICS_CACHE_VERSION_KEY, uuid.uuid4().hex, None)
+            version = cache.get(cls.ANALYTICS_CACHE_VERSION_KEY)
+        return version
+    
+    @classmethod
+    def bump_analytics_cache_version(cls):
+        # A random token rather than a counter: it never repeats, so a culled or
+        # concurrently-updated version key can't bring back entries from an old version
+        cache.set(cls.ANALYTICS_CACHE_VERSION_KEY, uuid.uuid4().hex, None)
+    
     def get_total_views(self):
         """Calculate total views across all platforms."""
         return self.youtube_views + self.facebook_views
@@ -802,6 +937,5 @@ class AttendanceRecord(TimeStampedModel):
         ordering = ['-date']
         verbose_name = "Attendance Record"
         verbose_name_plural = "Attendance Records"
-        indexes = [
-            models.Index(fields=['-date']),
-        ]
+        # No separate date index: the unique constraint on date already provides
+        # one, which serves the analytics range filters and ordering in both directions
@@ -239,6 +239,18 @@ def send_coordinator_application_notification(application):
             print(f"ERROR: Movement application notification failed: {e}")
 
 
+def send_coordinator_application_emails(application):
+    """
+    Send the admin notification and the applicant's confirmation email.
+    Runs in the request (there is no task queue, and detached threads aren't reliable
+    under uWSGI); EMAIL_TIMEOUT bounds how long a slow SMTP server can hold it up.
+    The senders log their own SMTP failures, but building the messages can still raise,
+    so callers should guard the call.
+    """
+    send_coordinator_application_notification(application)
+    send_coordinator_application_confirmation_email(application)
+
+
 def send_booking_approval_notifications(booking):
     """
     Send email and SMS notifications when a booking is approved.
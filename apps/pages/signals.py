@@ -0,0 +1,48 @@
+"""
+Signal handlers for the pages app.
+Keeps cached admin dashboard data, the cached 40 Days configurations and the cached
+attendance analytics in step with the database.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import (
+    Donation, CounselingBooking, Question, CoordinatorApplication, FortyDaysConfig, AttendanceRecord,
+)
+
+
+# Headline stats for the staff dashboard (see AdminDashboardView)
+DASHBOARD_STATS_CACHE_KEY = 'admin_dashboard_stats_v1'
+
+
+def clear_dashboard_stats_cache():
+    """
+    Drop the cached dashboard stats. The cache is shared by all workers, so this takes
+    effect everywhere; also called after queryset updates, which don't send post_save.
+    """
+    cache.delete(DASHBOARD_STATS_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=Donation)
+@receiver([post_save, post_delete], sender=CounselingBooking)
+@receiver([post_save, post_delete], sender=Question)
+@receiver([post_save, post_delete], sender=CoordinatorApplication)
+def clear_dashboard_stats(sender, **kwargs):
+    """Drop the cached dashboard stats when a submission is added, changed or removed."""
+    clear_dashboard_stats_cache()
+
+
+@receiver([post_save, post_delete], sender=FortyDaysConfig)
+def clear_forty_days_config_cache(sender, **kwargs):
+    """Drop the cached active 40 Days configuration and year ranges when any configuration changes."""
+    cache.delete_many([FortyDaysConfig.ACTIVE_CACHE_KEY, FortyDaysConfig.YEAR_RANGES_CACHE_KEY])
+
+
+@receiver([post_save, post_delete], sender=AttendanceRecord)
+def bump_attendance_analytics_version(sender, **kwargs):
+    """
+    Start a new analytics cache version when an attendance record changes; post_delete
+    also fires for each row of an admin bulk delete.
+    """
+    AttendanceRecord.bump_analytics_cache_version()
@@ -13,6 +13,7 @@ urlpatterns = [
     path('donate/', views.DonationView.as_view(), name='donate'),
     path('donate/checkout/', views.DonationCheckoutView.as_view(), name='donate-checkout'),
     path('donate/thanks/', views.DonationThanksView.as_view(), name='donate-thanks'),
+    path('donate/webhook/', views.PaystackWebhookView.as_view(), name='donate-webhook'),
     path('counseling/', views.CounselingBookingView.as_view(), name='counseling_booking'),
     path('questions/', views.QuestionSubmitView.as_view(), name='question_submit'),
     path('join-the-movement/', views.CoordinatorApplicationView.as_view(), name='coordinator_application'),
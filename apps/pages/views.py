@@ -8,21 +8,75 @@ from django.contrib.auth.views import LoginView, LogoutView
 from django.views.generic import TemplateView, View
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.conf import settings
+from django.core.cache import cache, caches
+from django.http import HttpResponse
 from django.urls import reverse_lazy
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+import hashlib
+import hmac
+import json
+import logging
 import requests
+from requests.adapters import HTTPAdapter
 from .models import (
     ContactMessage, Donation, FortyDaysConfig, SiteSettings,
-    CounselingBooking, PageView, AttendanceRecord, Question, CoordinatorApplication,
+    CounselingBooking, PageViewDaily, AttendanceRecord, Question, CoordinatorApplication,
+    Pledge,
+)
+from .signals import DASHBOARD_STATS_CACHE_KEY, clear_dashboard_stats_cache
+from .forms import CounselingBookingForm, QuestionForm, CoordinatorApplicationForm, PledgeForm
+from .notifications import (
+    send_booking_submission_notification, send_pledge_submission_notification,
+    send_question_submission_notification, send_coordinator_application_emails,
+    WHATSAPP_STUDENT_GROUP_URL, WHATSAPP_PROFESSIONAL_GROUP_URL,
 )
-from .forms import CounselingBookingForm, QuestionForm, CoordinatorApplicationForm
 from apps.devotions.models import Devotion
 from apps.events.models import Event
 from apps.resources.models import Resource
 from apps.community.models import Testimony, PrayerRequest
-from django.db.models import Sum, Count, Q
-from django.db.models.functions import TruncDate
+from apps.subscriptions.models import Subscriber
+from django.db.models import Sum, Count, Q, F, Avg, Max
+from django.db.models.functions import TruncWeek
 from django.utils import timezone
-from datetime import timedelta
+from datetime import date, time, timedelta
+from decimal import Decimal, InvalidOperation
+import zoneinfo
+
+logger = logging.getLogger(__name__)
+
+# Ghana time, used for all live-session windows
+ACCRA_TZ = zoneinfo.ZoneInfo("Africa/Accra")
+
+# Shared keep-alive session for Paystack calls, so checkouts and verifications
+# reuse an open TLS connection instead of handshaking on every request
+paystack_session = requests.Session()
+paystack_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# 40 Days live windows (Ghana time); the buttons appear 15 minutes before each session:
+# morning session 5:00-5:30am, evening session 6:00-7:00pm
+FORTY_DAYS_LIVE_WINDOWS = [
+    ('is_morning_live', time(4, 45), time(5, 30)),
+    ('is_evening_live', time(17, 45), time(19, 0)),
+]
+
+# Weekly programme live buttons (Ghana time):
+# (context flag, weekdays it runs on or None for every day, start, end, needs the Zoom link)
+PROGRAMME_LIVE_WINDOWS = [
+    # Uplift Your Morning: Facebook + YouTube live only (no Zoom)
+    ('show_uplift_live', None, time(5, 0), time(5, 30), False),
+    # Access Hour: Wednesdays (weekday=2)
+    ('show_access_hour_zoom', {2}, time(18, 0), time(19, 0), True),
+    # Edify: Fridays (weekday=4)
+    ('show_edify_zoom', {4}, time(18, 0), time(19, 0), True),
+]
+
+# 40 Days live-button start times (15 min before each session), in day order:
+# (hour, minute, session type, countdown label)
+FORTY_DAYS_SESSIONS = [
+    (4, 45, 'morning', '4:45 AM'),
+    (17, 45, 'evening', '5:45 PM'),
+]
 
 
 class HomeView(TemplateView):
@@ -34,23 +88,36 @@ class HomeView(TemplateView):
     - Featured testimonies
     """
     template_name = 'pages/home.html'
+    # Live-window flags and the countdown are always computed fresh; only DB content is cached
+    CONTENT_CACHE_TIMEOUT = 60
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Get today's devotion (optimized query)
-        from django.utils import timezone
-        import zoneinfo
-        today = timezone.now().date()
-        context['todays_devotion'] = Devotion.objects.filter(
-            publish_date=today,
-            is_published=True
-        ).select_related('series').first()
-        
-        # Get upcoming events (next 3) - optimized query
-        context['upcoming_events'] = Event.objects.filter(
-            start_datetime__gte=timezone.now()
-        ).order_by('start_datetime')[:3]
+        # Resolve "now" once (Ghana time) and reuse it for every time-based check below
+        now = timezone.now()
+        now_accra = now.astimezone(ACCRA_TZ)
+        today = now.date()
+
+        # Wall-clock time in Ghana, compared against the live-window tables below
+        time_accra = now_accra.time()
+
+        # Today's devotion and the next 3 events are the same for every visitor within a
+        # minute, so they are cached per calendar minute (per process; a new key every
+        # minute would only churn the shared cache)
+        context.update(caches['local'].get_or_set(
+            f'home_content:{int(now.timestamp() // 60)}',
+            lambda: {
+                'todays_devotion': Devotion.objects.filter(
+                    publish_date=today,
+                    is_published=True
+                ).select_related('series').first(),
+                'upcoming_events': list(Event.objects.filter(
+                    start_datetime__gte=now
+                ).order_by('start_datetime')[:3]),
+            },
+            self.CONTENT_CACHE_TIMEOUT,
+        ))
         
         # Get featured resources - optimized query
         context['featured_resources'] = Resource.objects.filter(
@@ -63,65 +130,43 @@ class HomeView(TemplateView):
             featured=True
         ).only('id', 'name', 'country', 'testimony', 'created_at')[:5]
         
-        # Check if we're in the active 40 Days period
-        forty_days_config = FortyDaysConfig.objects.filter(is_active=True).first()
-        context['is_40_days_active'] = False
-        context['forty_days_config'] = None
+        # Check if we're in the active 40 Days period (cached; cleared when a config changes)
+        forty_days_config = FortyDaysConfig.get_active_cached()
         
-        if forty_days_config:
-            # Check if today is within the date range
-            if forty_days_config.start_date <= today <= forty_days_config.end_date:
-                context['is_40_days_active'] = True
-                context['forty_days_config'] = forty_days_config
-                
-                # Calculate current day number (Day 1 = start_date)
-                days_elapsed = (today - forty_days_config.start_date).days + 1
-                context['forty_days_current_day'] = days_elapsed
-                context['forty_days_total_days'] = (forty_days_config.end_date - forty_days_config.start_date).days + 1
-                
-                # Check if we're in the live time windows (Ghana time)
-                # Live buttons appear 15 minutes before session starts
-                accra_tz = zoneinfo.ZoneInfo("Africa/Accra")
-                now_accra = timezone.now().astimezone(accra_tz)
-                from datetime import timedelta
-                
-                # Morning session: 5:00-5:30am (live buttons from 4:45am)
-                morning_start = now_accra.replace(hour=5, minute=0, second=0, microsecond=0)
-                morning_live_start = morning_start - timedelta(minutes=15)  # 15 min before
-                morning_end = now_accra.replace(hour=5, minute=30, second=0, microsecond=0)
-                context['is_morning_live'] = morning_live_start <= now_accra <= morning_end
-                
-                # Evening session: 6:00-7:00pm (live buttons from 5:45pm)
-                evening_start = now_accra.replace(hour=18, minute=0, second=0, microsecond=0)
-                evening_live_start = evening_start - timedelta(minutes=15)  # 15 min before
-                evening_end = now_accra.replace(hour=19, minute=0, second=0, microsecond=0)
-                context['is_evening_live'] = evening_live_start <= now_accra <= evening_end
-                
-                # Calculate next session time for countdown
-                current_hour = now_accra.hour
-                current_minute = now_accra.minute
-                
-                # Determine next session (considering 15 min early start)
-                if now_accra < morning_live_start:
-                    # Before morning session (before 4:45am) - next is morning
-                    next_session = morning_live_start
-                    context['next_session_type'] = 'morning'
-                    context['next_session_time'] = '4:45 AM'
-                elif now_accra < evening_live_start:
-                    # After morning, before evening (before 5:45pm) - next is evening
-                    next_session = evening_live_start
-                    context['next_session_type'] = 'evening'
-                    context['next_session_time'] = '5:45 PM'
-                else:
-                    # After evening - next is tomorrow's morning
-                    next_morning_live = (now_accra + timedelta(days=1)).replace(hour=4, minute=45, second=0, microsecond=0)
-                    next_session = next_morning_live
-                    context['next_session_type'] = 'morning'
-                    context['next_session_time'] = '4:45 AM (Tomorrow)'
-                
-                # Calculate time until next session (in seconds for JavaScript countdown)
-                time_until = (next_session - now_accra).total_seconds()
-                context['next_session_timestamp'] = int(time_until)
+        # Outside the campaign (most of the year) the whole 40 Days block is skipped
+        context.update({'is_40_days_active': False, 'forty_days_config': None})
+        
+        if forty_days_config and forty_days_config.start_date <= today <= forty_days_config.end_date:
+            context['is_40_days_active'] = True
+            context['forty_days_config'] = forty_days_config
+            
+            # Calculate current day number (Day 1 = start_date)
+            days_elapsed = (today - forty_days_config.start_date).days + 1
+            context['forty_days_current_day'] = days_elapsed
+            context['forty_days_total_days'] = (forty_days_config.end_date - forty_days_config.start_date).days + 1
+            
+            # Check if we're in the live time windows (Ghana time)
+            for flag, window_start, window_end in FORTY_DAYS_LIVE_WINDOWS:
+                context[flag] = window_start <= time_accra <= window_end
+            
+            # Next session for the countdown: first live start still ahead today,
+            # otherwise tomorrow's first session
+            upcoming = [
+                (now_accra.replace(hour=hour, minute=minute, second=0, microsecond=0), session_type, label)
+                for hour, minute, session_type, label in FORTY_DAYS_SESSIONS
+            ]
+            upcoming = [slot for slot in upcoming if slot[0] > now_accra]
+            if upcoming:
+                next_session, context['next_session_type'], context['next_session_time'] = upcoming[0]
+            else:
+                hour, minute, session_type, label = FORTY_DAYS_SESSIONS[0]
+                next_session = (now_accra + timedelta(days=1)).replace(hour=hour, minute=minute, second=0, microsecond=0)
+                context['next_session_type'] = session_type
+                context['next_session_time'] = f'{label} (Tomorrow)'
+            
+            # Calculate time until next session (in seconds for JavaScript countdown)
+            time_until = (next_session - now_accra).total_seconds()
+            context['next_session_timestamp'] = int(time_until)
         
         # Add timezone information for all sections (always available)
         # GMT = same as Ghana time (Africa/Accra)
@@ -135,28 +180,19 @@ class HomeView(TemplateView):
         context['evening_time_eat'] = '9:00 PM'
         
         # Get site settings (Zoom for Access Hour/Edify/40 Days; Facebook for Uplift Your Morning)
-        site_settings, _ = SiteSettings.objects.get_or_create(pk=1)
+        site_settings = SiteSettings.get_cached()
         zoom_link = site_settings.zoom_link
         context['global_zoom_link'] = zoom_link
         context['uplift_morning_facebook_url'] = site_settings.uplift_morning_facebook_url or ''
         
         # Time-based logic for live buttons
-        accra_tz = zoneinfo.ZoneInfo("Africa/Accra")
-        now_accra = timezone.now().astimezone(accra_tz)
         current_weekday = now_accra.weekday()  # 0=Monday, 6=Sunday
-        
-        # Uplift Your Morning: 5:00-5:30am (Ghana time) – show Facebook + YouTube live only in this window (no Zoom)
-        morning_start = now_accra.replace(hour=5, minute=0, second=0, microsecond=0)
-        morning_end = now_accra.replace(hour=5, minute=30, second=0, microsecond=0)
-        context['show_uplift_live'] = morning_start <= now_accra <= morning_end
-        
-        # Access Hour: 6:00-7:00pm GMT (Wednesday only, weekday=2)
-        evening_start = now_accra.replace(hour=18, minute=0, second=0, microsecond=0)
-        evening_end = now_accra.replace(hour=19, minute=0, second=0, microsecond=0)
-        context['show_access_hour_zoom'] = (current_weekday == 2) and (evening_start <= now_accra <= evening_end) and bool(zoom_link)
-        
-        # Edify: 6:00-7:00pm GMT (Friday only, weekday=4)
-        context['show_edify_zoom'] = (current_weekday == 4) and (evening_start <= now_accra <= evening_end) and bool(zoom_link)
+        for flag, weekdays, window_start, window_end, needs_zoom in PROGRAMME_LIVE_WINDOWS:
+            context[flag] = (
+                (weekdays is None or current_weekday in weekdays)
+                and (bool(zoom_link) or not needs_zoom)
+                and window_start <= time_accra <= window_end
+            )
         
         # For 40 Days, Zoom should only show during live sessions (already handled above)
         # We'll use the existing is_morning_live and is_evening_live flags
@@ -177,6 +213,8 @@ class AdminDashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
     This is separate from Django's built-in /admin/ interface.
     """
     template_name = 'pages/admin_dashboard.html'
+    # Headline stats are shared by all staff; new submissions clear them (see signals.py)
+    STATS_CACHE_TIMEOUT = 60
 
     def test_func(self):
         # Only allow staff/superusers to see this dashboard
@@ -187,61 +225,145 @@ class AdminDashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
         # Tell the base template that we're in the admin area
         context['hide_main_nav'] = True
 
+        # ?fresh=1 bypasses the cache
+        stats = None if self.request.GET.get('fresh') == '1' else cache.get(DASHBOARD_STATS_CACHE_KEY)
+        if stats is None:
+            stats = self.get_stats()
+            cache.set(DASHBOARD_STATS_CACHE_KEY, stats, self.STATS_CACHE_TIMEOUT)
+
+        # Recent activity (kept out of the cache so new submissions show up immediately)
+        # None of these models has a foreign key the template follows, so there is nothing
+        # to select_related; only() narrows the wide text columns instead
+        context['recent_devotions'] = Devotion.objects.order_by('-created_at').only(
+            'id', 'title', 'publish_date', 'is_published'
+        )[:5]
+        context['recent_events'] = Event.objects.order_by('-created_at').only(
+            'id', 'title', 'start_datetime', 'location'
+        )[:5]
+        context['recent_prayers'] = PrayerRequest.objects.order_by('-created_at').only(
+            'id', 'request', 'is_prayed_for', 'created_at'
+        )[:5]
+        # Latest donations only (full history is under Manage > Donations);
+        # only() skips the large raw_response payload
+        context['recent_donations'] = Donation.objects.order_by('-created_at').only(
+            'id', 'name', 'email', 'amount_ghs', 'status', 'created_at'
+        )[:50]
+        context['recent_counseling'] = CounselingBooking.objects.order_by('-created_at').only(
+            'id', 'full_name', 'preferred_date', 'preferred_time', 'status'
+        )[:5]
+        context['recent_questions'] = Question.objects.order_by('-created_at').only(
+            'id', 'name', 'category', 'question', 'status'
+        )[:5]
+        context['recent_coordinator_apps'] = CoordinatorApplication.objects.order_by('-created_at').only(
+            'id', 'name', 'application_type', 'campus_name', 'role_or_profession',
+            'organisation_name', 'status'
+        )[:5]
+        # Get recent subscribers for the dashboard list (limit to 10 most recent);
+        # the short "recent" list is the first five of the same query
+        all_subscribers = list(Subscriber.objects.order_by('-created_at')[:10])
+        context['all_subscribers'] = all_subscribers
+        context['recent_subscribers'] = all_subscribers[:5]
+
+        context['stats'] = stats
+        return context
+
+    def get_stats(self):
+        """Build the headline counts and page-view analytics for the dashboard."""
+        # Each block below is a single aggregate query with filtered counts
+
         # Devotions
-        total_devotions = Devotion.objects.count()
-        published_devotions = Devotion.objects.filter(is_published=True).count()
+        devotion_counts = Devotion.objects.aggregate(
+            total=Count('id'),
+            published=Count('id', filter=Q(is_published=True)),
+        )
+        total_devotions = devotion_counts['total']
+        published_devotions = devotion_counts['published']
 
         # Events
         now = timezone.now()
-        upcoming_events = Event.objects.filter(start_datetime__gte=now).count()
-        past_events = Event.objects.filter(start_datetime__lt=now).count()
+        event_counts = Event.objects.aggregate(
+            upcoming=Count('id', filter=Q(start_datetime__gte=now)),
+            past=Count('id', filter=Q(start_datetime__lt=now)),
+        )
+        upcoming_events = event_counts['upcoming']
+        past_events = event_counts['past']
 
         # Resources
         total_resources = Resource.objects.count()
 
         # Community (prayers and testimonies)
-        total_prayer_requests = PrayerRequest.objects.count()
-        open_prayer_requests = PrayerRequest.objects.filter(is_prayed_for=False).count()
-        total_testimonies = Testimony.objects.count()
-        pending_testimonies = Testimony.objects.filter(is_approved=False).count()
-
-        # Donations
-        total_donations = Donation.objects.count()
-        successful_donations = Donation.objects.filter(status=Donation.STATUS_SUCCESS)
-        successful_donations_count = successful_donations.count()
-        successful_donations_total = successful_donations.aggregate(
-            total=Sum('amount_ghs')
-        )['total'] or 0
-        # Also get pending and failed counts for completeness
-        pending_donations_count = Donation.objects.filter(status=Donation.STATUS_PENDING).count()
-        failed_donations_count = Donation.objects.filter(status=Donation.STATUS_FAILED).count()
+        prayer_counts = PrayerRequest.objects.aggregate(
+            total=Count('id'),
+            open=Count('id', filter=Q(is_prayed_for=False)),
+        )
+        total_prayer_requests = prayer_counts['total']
+        open_prayer_requests = prayer_counts['open']
+        testimony_counts = Testimony.objects.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(is_approved=False)),
+        )
+        total_testimonies = testimony_counts['total']
+        pending_testimonies = testimony_counts['pending']
+
+        # Donations - counts and the successful total
+        donation_counts = Donation.objects.aggregate(
+            total=Count('id'),
+            successful=Count('id', filter=Q(status=Donation.STATUS_SUCCESS)),
+            successful_amount=Sum('amount_ghs', filter=Q(status=Donation.STATUS_SUCCESS)),
+            pending=Count('id', filter=Q(status=Donation.STATUS_PENDING)),
+            failed=Count('id', filter=Q(status=Donation.STATUS_FAILED)),
+        )
+        total_donations = donation_counts['total']
+        successful_donations_count = donation_counts['successful']
+        successful_donations_total = donation_counts['successful_amount'] or 0
+        pending_donations_count = donation_counts['pending']
+        failed_donations_count = donation_counts['failed']
 
         # Counseling Bookings
-        total_counseling_bookings = CounselingBooking.objects.count()
-        pending_counseling = CounselingBooking.objects.filter(status=CounselingBooking.STATUS_PENDING).count()
-        approved_counseling = CounselingBooking.objects.filter(status=CounselingBooking.STATUS_APPROVED).count()
-        completed_counseling = CounselingBooking.objects.filter(status=CounselingBooking.STATUS_COMPLETED).count()
+        counseling_counts = CounselingBooking.objects.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status=CounselingBooking.STATUS_PENDING)),
+            approved=Count('id', filter=Q(status=CounselingBooking.STATUS_APPROVED)),
+            completed=Count('id', filter=Q(status=CounselingBooking.STATUS_COMPLETED)),
+        )
+        total_counseling_bookings = counseling_counts['total']
+        pending_counseling = counseling_counts['pending']
+        approved_counseling = counseling_counts['approved']
+        completed_counseling = counseling_counts['completed']
 
         # Questions (from Submit a Question)
-        total_questions = Question.objects.count()
-        pending_questions = Question.objects.filter(status=Question.STATUS_PENDING).count()
-        answered_questions = Question.objects.filter(status=Question.STATUS_ANSWERED).count()
+        question_counts = Question.objects.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status=Question.STATUS_PENDING)),
+            answered=Count('id', filter=Q(status=Question.STATUS_ANSWERED)),
+        )
+        total_questions = question_counts['total']
+        pending_questions = question_counts['pending']
+        answered_questions = question_counts['answered']
 
         # Coordinator Applications (Join the Movement)
-        total_coordinator_apps = CoordinatorApplication.objects.count()
-        pending_coordinator_apps = CoordinatorApplication.objects.filter(status=CoordinatorApplication.STATUS_PENDING).count()
+        coordinator_counts = CoordinatorApplication.objects.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status=CoordinatorApplication.STATUS_PENDING)),
+        )
+        total_coordinator_apps = coordinator_counts['total']
+        pending_coordinator_apps = coordinator_counts['pending']
 
         # Subscriptions
-        from apps.subscriptions.models import Subscriber
-        total_subscribers = Subscriber.objects.count()
-        active_subscribers = Subscriber.objects.filter(is_active=True).count()
-        email_subscribers = Subscriber.objects.filter(channel=Subscriber.CHANNEL_EMAIL, is_active=True).count()
-        whatsapp_subscribers = Subscriber.objects.filter(channel=Subscriber.CHANNEL_WHATSAPP, is_active=True).count()
-        daily_devotion_subscribers = Subscriber.objects.filter(is_active=True, receive_daily_devotion=True).count()
-        special_programs_subscribers = Subscriber.objects.filter(is_active=True, receive_special_programs=True).count()
-        recent_subscribers = Subscriber.objects.order_by('-created_at')[:5]
-        # Get recent subscribers for the dashboard list (limit to 10 most recent)
-        all_subscribers = Subscriber.objects.order_by('-created_at')[:10]
+        subscriber_counts = Subscriber.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
+            email=Count('id', filter=Q(is_active=True, channel=Subscriber.CHANNEL_EMAIL)),
+            whatsapp=Count('id', filter=Q(is_active=True, channel=Subscriber.CHANNEL_WHATSAPP)),
+            daily_devotion=Count('id', filter=Q(is_active=True, receive_daily_devotion=True)),
+            special_programs=Count('id', filter=Q(is_active=True, receive_special_programs=True)),
+        )
+        total_subscribers = subscriber_counts['total']
+        active_subscribers = subscriber_counts['active']
+        email_subscribers = subscriber_counts['email']
+        whatsapp_subscribers = subscriber_counts['whatsapp']
+        daily_devotion_subscribers = subscriber_counts['daily_devotion']
+        special_programs_subscribers = subscriber_counts['special_programs']
 
         # Analytics - Page Views (optimized queries)
         # Handle case where PageView table doesn't exist yet (migrations not run)
@@ -252,35 +374,33 @@ class AdminDashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
             week_start = today_start - timedelta(days=6)
             month_start = today_start - timedelta(days=30)
             
-            # Use single query with aggregation for better performance
-            total_page_views = PageView.objects.count()
-            
-            # Optimize: Use single query with date filtering for all counts
-            page_views_today = PageView.objects.filter(created_at__gte=today_start).count()
-            page_views_week = PageView.objects.filter(created_at__gte=week_start).count()
-            page_views_month = PageView.objects.filter(created_at__gte=month_start).count()
+            # Everything below reads the per-day, per-page rollup kept up to date as views
+            # are recorded, so no query has to scan the raw PageView table
+            page_view_counts = PageViewDaily.objects.aggregate(
+                total=Sum('count'),
+                today=Sum('count', filter=Q(day__gte=today_start.date())),
+                week=Sum('count', filter=Q(day__gte=week_start.date())),
+                month=Sum('count', filter=Q(day__gte=month_start.date())),
+            )
+            total_page_views = page_view_counts['total'] or 0
+            page_views_today = page_view_counts['today'] or 0
+            page_views_week = page_view_counts['week'] or 0
+            page_views_month = page_view_counts['month'] or 0
             
-            # Most viewed pages (last 30 days) - optimized with limit
-            most_viewed_pages = list(PageView.objects.filter(
-                created_at__gte=month_start
-            ).values('path', 'page_name').annotate(
-                view_count=Count('id')
-            ).order_by('-view_count')[:10])
+            # Most viewed pages (last 30 days)
+            # Part of the stats cached by get_context_data(), so ?fresh=1 recomputes it too
+            most_viewed_pages = list(
+                PageViewDaily.objects.filter(day__gte=month_start.date()).values(
+                    'path', 'page_name'
+                ).annotate(view_count=Sum('count')).order_by('-view_count')[:10]
+            )
             
             # Page views by day (last 7 days) for chart
-            # Optimized: Use database aggregation for better performance
-            from django.db.models import Count as CountFunc
-            
-            daily_views_data = PageView.objects.filter(
-                created_at__gte=week_start
-            ).annotate(
-                day=TruncDate('created_at')
-            ).values('day').annotate(
-                count=CountFunc('id')
-            ).order_by('day')
-            
-            # Convert to dictionary for easy lookup
-            daily_counts = {item['day']: item['count'] for item in daily_views_data}
+            daily_counts = dict(
+                PageViewDaily.objects.filter(
+                    day__gte=week_start.date()
+                ).values('day').annotate(count=Sum('count')).order_by().values_list('day', 'count')
+            )
             
             # Build daily_views list with all 7 days (from 6 days ago to today)
             # This matches the week_start date range exactly
@@ -307,19 +427,7 @@ class AdminDashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
             daily_views = []
             chart_total = 0
 
-        # Recent activity
-        context['recent_devotions'] = Devotion.objects.order_by('-created_at')[:5]
-        context['recent_events'] = Event.objects.order_by('-created_at')[:5]
-        context['recent_prayers'] = PrayerRequest.objects.order_by('-created_at')[:5]
-        # Show all donations to ensure nothing is missed
-        context['recent_donations'] = Donation.objects.all().order_by('-created_at')
-        context['recent_counseling'] = CounselingBooking.objects.order_by('-created_at')[:5]
-        context['recent_questions'] = Question.objects.order_by('-created_at')[:5]
-        context['recent_coordinator_apps'] = CoordinatorApplication.objects.order_by('-created_at')[:5]
-        context['recent_subscribers'] = recent_subscribers
-        context['all_subscribers'] = all_subscribers
-
-        context['stats'] = {
+        return {
             'devotions': {
                 'total': total_devotions,
                 'published': published_devotions,
@@ -378,8 +486,6 @@ class AdminDashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
             },
         }
 
-        return context
-
 
 class AdminLoginView(LoginView):
     """Custom admin login view with nice UI."""
@@ -431,7 +537,6 @@ class DonationCheckoutView(View):
             return redirect('pages:donate')
 
         try:
-            from decimal import Decimal, InvalidOperation
             amount_ghs_decimal = Decimal(amount_ghs)
             amount_pesewas = int(amount_ghs_decimal * 100)
         except (ValueError, InvalidOperation):
@@ -469,8 +574,8 @@ class DonationCheckoutView(View):
         }
 
         try:
-            response = requests.post('https://api.paystack.co/transaction/initialize',
-                                     json=data, headers=headers, timeout=30)
+            response = paystack_session.post('https://api.paystack.co/transaction/initialize',
+                                             json=data, headers=headers, timeout=30)
             response_data = response.json()
         except Exception:
             messages.error(request, 'Unable to connect to payment service. Please try again later.')
@@ -493,7 +598,11 @@ class DonationCheckoutView(View):
                 paystack_reference=paystack_ref,
                 status=Donation.STATUS_PENDING,
                 note=reference or '',
-                raw_response=init_data,
+                # Only the fields needed to resume/trace the checkout, not the whole payload
+                raw_response={
+                    key: init_data.get(key)
+                    for key in ('authorization_url', 'access_code', 'reference')
+                },
             )
 
             return redirect(auth_url)
@@ -502,6 +611,29 @@ class DonationCheckoutView(View):
         return redirect('pages:donate')
 
 
+def _charge_matches_donation(charge, donation):
+    """
+    Return True if a Paystack charge is for the amount and currency the donation was
+    initialised with; a mismatch is logged.
+    """
+    expected_amount = int(donation.amount_ghs * 100)
+    if charge.get('amount') == expected_amount and charge.get('currency') == 'GHS':
+        return True
+    logger.error(
+        f"Paystack charge {charge.get('reference')} does not match donation {donation.pk}: "
+        f"got {charge.get('amount')} {charge.get('currency')}, expected {expected_amount} GHS"
+    )
+    return False
+
+
+def _paystack_charge_summary(charge):
+    """The fields of a Paystack charge worth keeping on the Donation, not the whole payload."""
+    return {
+        key: charge.get(key)
+        for key in ('id', 'reference', 'status', 'amount', 'currency', 'channel', 'paid_at')
+    }
+
+
 class DonationThanksView(TemplateView):
     """
     Thank-you page after Paystack redirects back.
@@ -526,12 +658,18 @@ class DonationThanksView(TemplateView):
         except Donation.DoesNotExist:
             donation = None
 
+        # The Paystack webhook usually confirms the charge before the donor is redirected
+        # back, in which case there is no need to call the verify API again
+        if donation and donation.status == Donation.STATUS_SUCCESS:
+            messages.success(request, 'Your donation has been received successfully. Thank you!')
+            return super().get(request, *args, **kwargs)
+
         headers = {
             'Authorization': f'Bearer {paystack_secret_key}',
         }
 
         try:
-            verify_resp = requests.get(
+            verify_resp = paystack_session.get(
                 f'https://api.paystack.co/transaction/verify/{reference}',
                 headers=headers,
                 timeout=30
@@ -544,12 +682,25 @@ class DonationThanksView(TemplateView):
         status_ok = verify_data.get('status') and verify_data.get('data', {}).get('status') == 'success'
 
         if donation:
-            donation.raw_response = verify_data.get('data')
-            if status_ok:
-                donation.status = Donation.STATUS_SUCCESS
+            charge = verify_data.get('data') or {}
+            if status_ok and not _charge_matches_donation(charge, donation):
+                # Leave the donation pending for an admin to look at
+                status_ok = False
             else:
-                donation.status = Donation.STATUS_FAILED
-            donation.save(update_fields=['status', 'raw_response', 'updated_at'])
+                # A single UPDATE; it skips post_save, so clear the dashboard stats here.
+                # Never downgrade a donation the webhook has already confirmed (e.g. on reload)
+                updated = Donation.objects.filter(pk=donation.pk).exclude(
+                    status=Donation.STATUS_SUCCESS,
+                ).update(
+                    status=Donation.STATUS_SUCCESS if status_ok else Donation.STATUS_FAILED,
+                    raw_response=_paystack_charge_summary(charge),
+                    updated_at=timezone.now(),
+                )
+                if updated:
+                    clear_dashboard_stats_cache()
+                elif not status_ok:
+                    # The webhook confirmed the payment while we were verifying
+                    status_ok = Donation.objects.filter(pk=donation.pk, status=Donation.STATUS_SUCCESS).exists()
 
         if not status_ok:
             messages.error(request, 'Your payment could not be confirmed. If money was deducted, please contact support.')
@@ -559,6 +710,54 @@ class DonationThanksView(TemplateView):
         return super().get(request, *args, **kwargs)
 
 
+@method_decorator(csrf_exempt, name='dispatch')
+class PaystackWebhookView(View):
+    """
+    Receives Paystack webhook events and marks donations as paid in the background,
+    so the thank-you page rarely has to wait on the verify API.
+    Requests are authenticated with the X-Paystack-Signature header (HMAC-SHA512 of the body).
+    """
+
+    def post(self, request, *args, **kwargs):
+        paystack_secret_key = getattr(settings, 'PAYSTACK_SECRET_KEY', '')
+        if not paystack_secret_key:
+            return HttpResponse(status=503)
+
+        expected = hmac.new(paystack_secret_key.encode(), request.body, hashlib.sha512).hexdigest()
+        if not hmac.compare_digest(expected, request.headers.get('X-Paystack-Signature', '')):
+            return HttpResponse(status=401)
+
+        try:
+            payload = json.loads(request.body)
+        except ValueError:
+            return HttpResponse(status=400)
+
+        # Only successful charges change anything; other events are acknowledged and ignored
+        if payload.get('event') == 'charge.success':
+            data = payload.get('data') or {}
+            reference = data.get('reference') or ''
+            donation = Donation.objects.filter(
+                paystack_reference=reference,
+            ).exclude(status=Donation.STATUS_SUCCESS).first()
+            if donation is None:
+                return HttpResponse(status=200)
+
+            if not _charge_matches_donation(data, donation):
+                return HttpResponse(status=200)
+
+            updated = Donation.objects.filter(pk=donation.pk).exclude(
+                status=Donation.STATUS_SUCCESS,
+            ).update(
+                status=Donation.STATUS_SUCCESS,
+                raw_response=_paystack_charge_summary(data),
+                updated_at=timezone.now(),
+            )
+            if updated:
+                clear_dashboard_stats_cache()
+
+        return HttpResponse(status=200)
+
+
 class CounselingBookingView(TemplateView):
     """
     View for users to submit counseling booking requests.
@@ -567,7 +766,8 @@ class CounselingBookingView(TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['form'] = CounselingBookingForm()
+        if 'form' not in context:
+            context['form'] = CounselingBookingForm()
         return context
     
     def post(self, request, *args, **kwargs):
@@ -577,7 +777,6 @@ class CounselingBookingView(TemplateView):
             booking.status = CounselingBooking.STATUS_PENDING
             booking.save()
             # Send email notification to admin
-            from .notifications import send_booking_submission_notification
             try:
                 send_booking_submission_notification(booking)
             except Exception:
@@ -591,8 +790,7 @@ class CounselingBookingView(TemplateView):
             return redirect('pages:counseling_booking')
         else:
             messages.error(request, 'Please correct the errors below.')
-            context = self.get_context_data(**kwargs)
-            context['form'] = form
+            context = self.get_context_data(form=form, **kwargs)
             return self.render_to_response(context)
 
 
@@ -604,14 +802,11 @@ class PledgeFormView(TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        from .forms import PledgeForm
-        context['form'] = PledgeForm()
+        if 'form' not in context:
+            context['form'] = PledgeForm()
         return context
     
     def post(self, request, *args, **kwargs):
-        from .forms import PledgeForm
-        from .models import Pledge
-        
         form = PledgeForm(request.POST)
         if form.is_valid():
             pledge = form.save(commit=False)
@@ -626,7 +821,6 @@ class PledgeFormView(TemplateView):
             pledge.status = Pledge.STATUS_PENDING
             pledge.save()
             # Send email notification to admin
-            from .notifications import send_pledge_submission_notification
             try:
                 send_pledge_submission_notification(pledge)
             except Exception:
@@ -639,8 +833,7 @@ class PledgeFormView(TemplateView):
             return redirect('pages:pledge_form')
         else:
             messages.error(request, 'Please correct the errors below.')
-            context = self.get_context_data(**kwargs)
-            context['form'] = form
+            context = self.get_context_data(form=form, **kwargs)
             return self.render_to_response(context)
 
 
@@ -653,7 +846,8 @@ class QuestionSubmitView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['form'] = QuestionForm()
+        if 'form' not in context:
+            context['form'] = QuestionForm()
         return context
 
     def post(self, request, *args, **kwargs):
@@ -662,7 +856,6 @@ class QuestionSubmitView(TemplateView):
             question = form.save(commit=False)
             question.status = Question.STATUS_PENDING
             question.save()
-            from .notifications import send_question_submission_notification
             try:
                 send_question_submission_notification(question)
             except Exception:
@@ -673,8 +866,7 @@ class QuestionSubmitView(TemplateView):
             )
             return redirect('pages:question_submit')
         messages.error(request, 'Please correct the errors below.')
-        context = self.get_context_data(**kwargs)
-        context['form'] = form
+        context = self.get_context_data(form=form, **kwargs)
         return self.render_to_response(context)
 
 
@@ -686,7 +878,8 @@ class CoordinatorApplicationView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['form'] = CoordinatorApplicationForm()
+        if 'form' not in context:
+            context['form'] = CoordinatorApplicationForm()
         return context
 
     def post(self, request, *args, **kwargs):
@@ -695,21 +888,17 @@ class CoordinatorApplicationView(TemplateView):
             application = form.save(commit=False)
             application.status = CoordinatorApplication.STATUS_PENDING
             application.save()
-            from .notifications import send_coordinator_application_notification, send_coordinator_application_confirmation_email
             try:
-                send_coordinator_application_notification(application)
+                send_coordinator_application_emails(application)
             except Exception:
-                pass
-            try:
-                send_coordinator_application_confirmation_email(application)
-            except Exception:
-                pass
+                # The application is saved; a notification failure must not turn that into an error page
+                logger.exception(f"Failed to send coordinator application emails for application {application.pk}")
             # Redirect to thank-you page with WhatsApp link for their group (student or professional)
             type_param = 'student' if application.application_type == CoordinatorApplication.TYPE_STUDENT else 'professional'
             return redirect('pages:coordinator_application_success', application_type=type_param)
         messages.error(request, 'Please correct the errors below.')
-        context = self.get_context_data(**kwargs)
-        context['form'] = form
+        # Pass the bound form in so get_context_data doesn't build a blank one
+        context = self.get_context_data(form=form, **kwargs)
         return self.render_to_response(context)
 
 
@@ -721,7 +910,6 @@ class CoordinatorApplicationSuccessView(TemplateView):
     template_name = 'pages/coordinator_application_success.html'
 
     def get_context_data(self, **kwargs):
-        from .notifications import WHATSAPP_STUDENT_GROUP_URL, WHATSAPP_PROFESSIONAL_GROUP_URL
         context = super().get_context_data(**kwargs)
         application_type = self.kwargs.get('application_type', 'student')
         if application_type == 'professional':
@@ -743,12 +931,10 @@ class AttendanceAnalyticsPublicView(TemplateView):
     """
     template_name = 'pages/attendance_analytics.html'
     access_code_template = 'pages/attendance_analytics_access.html'
+    ANALYTICS_CACHE_TIMEOUT = 3600
     
     def dispatch(self, request, *args, **kwargs):
         """Check access code before allowing access."""
-        from django.conf import settings
-        from django.contrib import messages
-        
         # Check if access code is provided in session or query parameter
         access_code = request.GET.get('code', '')
         session_code = request.session.get('attendance_analytics_authenticated', False)
@@ -758,11 +944,14 @@ class AttendanceAnalyticsPublicView(TemplateView):
         
         # If code is provided in URL, validate it
         if access_code:
-            if access_code == required_code:
-                # Store in session for future visits
-                request.session['attendance_analytics_authenticated'] = True
-                request.session.set_expiry(86400 * 7)  # 7 days
-                messages.success(request, 'Access granted! You can now view the analytics.')
+            # Constant-time comparison so the code can't be guessed from response timing
+            if hmac.compare_digest(access_code.encode(), required_code.encode()):
+                # Store in session for future visits; skip when already granted so
+                # bookmarked ?code= links don't rewrite the session on every visit
+                if not session_code:
+                    request.session['attendance_analytics_authenticated'] = True
+                    request.session.set_expiry(86400 * 7)  # 7 days
+                    messages.success(request, 'Access granted! You can now view the analytics.')
                 return super().dispatch(request, *args, **kwargs)
             else:
                 messages.error(request, 'Invalid access code. Please try again.')
@@ -779,97 +968,116 @@ class AttendanceAnalyticsPublicView(TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        import json
-        from datetime import datetime, timedelta
         
         # Get date range from query params (default to last 30 days)
         date_to = self.request.GET.get('date_to')
         date_from = self.request.GET.get('date_from')
         
         if not date_to:
-            date_to = datetime.now().date()
+            date_to = date.today()
         else:
-            date_to = datetime.strptime(date_to, '%Y-%m-%d').date()
+            date_to = date.fromisoformat(date_to)
         
         if not date_from:
             date_from = date_to - timedelta(days=30)
         else:
-            date_from = datetime.strptime(date_from, '%Y-%m-%d').date()
+            date_from = date.fromisoformat(date_from)
         
-        # Get records in date range
+        # Get records in date range (only the columns the analytics read)
         records = AttendanceRecord.objects.filter(
             date__gte=date_from,
             date__lte=date_to
-        ).order_by('date')
+        ).only('date', 'youtube_views', 'facebook_views').order_by('date')
         
-        # Prepare data for charts
-        dates = [r.date.strftime('%Y-%m-%d') for r in records]
-        youtube_views = [r.youtube_views for r in records]
-        facebook_views = [r.facebook_views for r in records]
-        total_views = [r.get_total_views() for r in records]
+        # Chart series and stats are cached per date range; saving or deleting
+        # a record bumps the cache version, so stale entries are never read
+        cache_key = 'attendance_analytics:{}:{}:{}'.format(
+            AttendanceRecord.get_analytics_cache_version(), date_from, date_to,
+        )
+        analytics = cache.get(cache_key)
+        if analytics is None:
+            analytics = self.get_analytics(records)
+            cache.set(cache_key, analytics, self.ANALYTICS_CACHE_TIMEOUT)
         
-        # Convert to JSON for JavaScript
-        dates_json = json.dumps(dates)
-        youtube_views_json = json.dumps(youtube_views)
-        facebook_views_json = json.dumps(facebook_views)
-        total_views_json = json.dumps(total_views)
+        context.update(analytics)
+        context.update({
+            'date_from': date_from.strftime('%Y-%m-%d'),
+            'date_to': date_to.strftime('%Y-%m-%d'),
+            'num_days': (date_to - date_from).days + 1,
+        })
+        return context
+    
+    def get_analytics(self, records):
+        """Build the chart series and summary stats for the given records."""
+        # Combined views per day, computed by the database
+        records = records.annotate(total=F('youtube_views') + F('facebook_views'))
         
-        # Calculate statistics
-        total_youtube = sum(youtube_views)
-        total_facebook = sum(facebook_views)
-        total_all = sum(total_views)
+        # Prepare data for charts in a single pass (plain tuples, no model instances needed)
+        dates, youtube_views, facebook_views, total_views = [], [], [], []
+        rows = records.values_list('date', 'youtube_views', 'facebook_views', 'total')
+        # Stream rows so long date ranges don't hold the whole result set in memory
+        for day, yt, fb, total in rows.iterator(chunk_size=2000):
+            dates.append(day.isoformat())
+            youtube_views.append(yt)
+            facebook_views.append(fb)
+            total_views.append(total)
         
-        avg_youtube = total_youtube / len(records) if records else 0
-        avg_facebook = total_facebook / len(records) if records else 0
-        avg_total = total_all / len(records) if records else 0
+        # Calculate statistics in one aggregate query
+        stats = records.aggregate(
+            num_records=Count('id'),
+            total_youtube=Sum('youtube_views'),
+            total_facebook=Sum('facebook_views'),
+            total_all=Sum('total'),
+            avg_youtube=Avg('youtube_views'),
+            avg_facebook=Avg('facebook_views'),
+            avg_total=Avg('total'),
+            peak_views=Max('total'),
+        )
+        num_records = stats['num_records']
+        total_youtube = stats['total_youtube'] or 0
+        total_facebook = stats['total_facebook'] or 0
+        total_all = stats['total_all'] or 0
+        avg_youtube = stats['avg_youtube'] or 0
+        avg_facebook = stats['avg_facebook'] or 0
+        avg_total = stats['avg_total'] or 0
+        peak_views = stats['peak_views'] or 0
         
-        # Find peak days
-        peak_day = None
-        peak_views = 0
-        for r in records:
-            total = r.get_total_views()
-            if total > peak_views:
-                peak_views = total
-                peak_day = r
+        # Find peak day (earliest day with the highest total)
+        peak_day = records.order_by('-total', 'date').values(
+            'date', 'youtube_views', 'facebook_views', 'total',
+        ).first() if num_records and peak_views else None
         
-        # Weekly aggregates
-        weekly_data = {}
-        for r in records:
-            week_start = r.date - timedelta(days=r.date.weekday())
-            week_key = week_start.strftime('%Y-%m-%d')
-            if week_key not in weekly_data:
-                weekly_data[week_key] = {
-                    'youtube': 0,
-                    'facebook': 0,
-                    'total': 0,
-                    'count': 0
-                }
-            weekly_data[week_key]['youtube'] += r.youtube_views
-            weekly_data[week_key]['facebook'] += r.facebook_views
-            weekly_data[week_key]['total'] += r.get_total_views()
-            weekly_data[week_key]['count'] += 1
+        # Weekly aggregates (weeks start on Monday), grouped in the database
+        weekly_rows = records.annotate(
+            week=TruncWeek('date')
+        ).values('week').annotate(
+            youtube=Sum('youtube_views'),
+            facebook=Sum('facebook_views'),
+            week_total=Sum('total'),
+        ).order_by('week') if num_records else []
         
-        weekly_dates = sorted(weekly_data.keys())
-        weekly_youtube = [weekly_data[w]['youtube'] for w in weekly_dates]
-        weekly_facebook = [weekly_data[w]['facebook'] for w in weekly_dates]
-        weekly_total = [weekly_data[w]['total'] for w in weekly_dates]
+        weekly_dates, weekly_youtube, weekly_facebook, weekly_total = [], [], [], []
+        for week in weekly_rows:
+            weekly_dates.append(week['week'].isoformat())
+            weekly_youtube.append(week['youtube'])
+            weekly_facebook.append(week['facebook'])
+            weekly_total.append(week['week_total'])
         
-        # Convert weekly data to JSON
-        weekly_dates_json = json.dumps(weekly_dates)
-        weekly_youtube_json = json.dumps(weekly_youtube)
-        weekly_facebook_json = json.dumps(weekly_facebook)
-        weekly_total_json = json.dumps(weekly_total)
+        # All chart series go to JavaScript as one payload (rendered with json_script)
+        chart_data = {
+            'dates': dates,
+            'youtube_views': youtube_views,
+            'facebook_views': facebook_views,
+            'total_views': total_views,
+            'weekly_dates': weekly_dates,
+            'weekly_youtube': weekly_youtube,
+            'weekly_facebook': weekly_facebook,
+            'weekly_total': weekly_total,
+        }
         
-        context.update({
-            'records': records,
-            'dates': dates_json,
-            'youtube_views': youtube_views_json,
-            'facebook_views': facebook_views_json,
-            'total_views': total_views_json,
-            'weekly_dates': weekly_dates_json,
-            'weekly_youtube': weekly_youtube_json,
-            'weekly_facebook': weekly_facebook_json,
-            'weekly_total': weekly_total_json,
+        return {
+            'num_records': num_records,
+            'chart_data': chart_data,
             'total_youtube': total_youtube,
             'total_facebook': total_facebook,
             'total_all': total_all,
@@ -878,8 +1086,4 @@ class AttendanceAnalyticsPublicView(TemplateView):
             'avg_total': round(avg_total, 2),
             'peak_day': peak_day,
             'peak_views': peak_views,
-            'date_from': date_from.strftime('%Y-%m-%d'),
-            'date_to': date_to.strftime('%Y-%m-%d'),
-            'num_days': (date_to - date_from).days + 1,
-        })
-        return context
\ No newline at end of file
+        }
\ No newline at end of file
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0002_fortydaysnotecategory_fortydaysnote'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='resource',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['is_featured'], name='resource_featured_idx'),
+        ),
+    ]
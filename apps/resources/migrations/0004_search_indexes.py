@@ -0,0 +1,39 @@
+# Generated by Django 5.2.8
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+# Full-text indexes for the ?search= lookups in resources/views.py; the expressions must
+# match the SearchVector used there. PostgreSQL only (SQLite dev keeps icontains scans).
+SEARCH_INDEXES = [
+    ('Resource', 'resource_search_idx', ('title', 'description')),
+    ('FortyDaysNote', 'fortydaysnote_search_idx', ('title', 'content', 'expert_name')),
+]
+
+
+def add_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name, index_name, fields in SEARCH_INDEXES:
+        model = apps.get_model('resources', model_name)
+        schema_editor.add_index(model, GinIndex(SearchVector(*fields, config='english'), name=index_name))
+
+
+def remove_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name, index_name, fields in SEARCH_INDEXES:
+        model = apps.get_model('resources', model_name)
+        schema_editor.remove_index(model, GinIndex(SearchVector(*fields, config='english'), name=index_name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0003_resource_featured_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_indexes, remove_search_indexes),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0004_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='resource',
+            index=models.Index(fields=['-created_at'], name='resource_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=models.Index(fields=['category', '-created_at'], name='resource_cat_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=models.Index(fields=['type', '-created_at'], name='resource_type_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fortydaysnote',
+            index=models.Index(fields=['is_published', '-session_date', '-created_at'], name='note_published_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fortydaysnote',
+            index=models.Index(fields=['category', '-session_date'], name='note_cat_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fortydaysnote',
+            index=models.Index(fields=['is_published', 'is_featured'], name='note_published_featured_idx'),
+        ),
+    ]
@@ -1,11 +1,13 @@
 """
 Models for the resources library (PDFs, audio, videos, etc.).
 """
+from django.core.cache import cache
 from django.db import models
-from django.utils.text import slugify
+from django.db.models import Q
 from django.utils import timezone
 from datetime import date
 from apps.core.models import TimeStampedModel
+from apps.core.slugs import fast_slugify
 
 
 class ResourceCategory(TimeStampedModel):
@@ -16,14 +18,38 @@ class ResourceCategory(TimeStampedModel):
     slug = models.SlugField(unique=True)
     description = models.TextField(blank=True)
 
+    # Filter options on the resources list; cleared on change in every worker
+    # (see signals.py); the timeout bounds staleness from writes that skip signals
+    CACHE_KEY = 'resource_categories_v1'
+    CACHE_TIMEOUT = 300
+
     def __str__(self):
         return self.name
 
+    @classmethod
+    def get_cached_list(cls):
+        """Return all categories as a list, served from the cache."""
+        return cache.get_or_set(cls.CACHE_KEY, lambda: list(cls.objects.all()), cls.CACHE_TIMEOUT)
+
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
+        # Partial saves that don't write the slug (e.g. counter updates) skip generating it
+        update_fields = kwargs.get('update_fields')
+        if not self.slug and (update_fields is None or 'slug' in update_fields):
+            self.slug = fast_slugify(self.name)
         super().save(*args, **kwargs)
 
+    @classmethod
+    def with_slugs(cls, categories, **kwargs):
+        """
+        Bulk-insert unsaved categories, filling in missing slugs first.
+        bulk_create() bypasses save(), so this is the import path that keeps slugs set.
+        """
+        categories = list(categories)
+        for category in categories:
+            if not category.slug:
+                category.slug = fast_slugify(category.name)
+        return cls.objects.bulk_create(categories, **kwargs)
+
 
 class Resource(TimeStampedModel):
     """
@@ -51,14 +77,37 @@ class Resource(TimeStampedModel):
     is_featured = models.BooleanField(default=False)
     download_count = models.PositiveIntegerField(default=0)
 
+    class Meta:
+        indexes = [
+            # Only a handful of resources are featured (home page), so a partial index stays tiny
+            models.Index(fields=['is_featured'], name='resource_featured_idx', condition=Q(is_featured=True)),
+            # List page: newest first, optionally filtered by category or type
+            models.Index(fields=['-created_at'], name='resource_created_idx'),
+            models.Index(fields=['category', '-created_at'], name='resource_cat_created_idx'),
+            models.Index(fields=['type', '-created_at'], name='resource_type_created_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
+        update_fields = kwargs.get('update_fields')
+        if not self.slug and (update_fields is None or 'slug' in update_fields):
+            self.slug = fast_slugify(self.title)
         super().save(*args, **kwargs)
 
+    @classmethod
+    def with_slugs(cls, resources, **kwargs):
+        """
+        Bulk-insert unsaved resources (e.g. a catalogue import) in one INSERT,
+        filling in missing slugs first since bulk_create() bypasses save().
+        """
+        resources = list(resources)
+        for resource in resources:
+            if not resource.slug:
+                resource.slug = fast_slugify(resource.title)
+        return cls.objects.bulk_create(resources, **kwargs)
+
 
 class FortyDaysNoteCategory(TimeStampedModel):
     """
@@ -69,6 +118,11 @@ class FortyDaysNoteCategory(TimeStampedModel):
     description = models.TextField(blank=True)
     order = models.PositiveIntegerField(default=0, help_text="Order for displaying categories")
 
+    # Filter options on the 40 Days list; cleared on change in every worker
+    # (see signals.py); the timeout bounds staleness from writes that skip signals
+    CACHE_KEY = 'fortydays_note_categories_v1'
+    CACHE_TIMEOUT = 300
+
     class Meta:
         verbose_name = "40 Days Note Category"
         verbose_name_plural = "40 Days Note Categories"
@@ -77,9 +131,15 @@ class FortyDaysNoteCategory(TimeStampedModel):
     def __str__(self):
         return self.name
 
+    @classmethod
+    def get_cached_list(cls):
+        """Return all categories in display order as a list, served from the cache."""
+        return cache.get_or_set(cls.CACHE_KEY, lambda: list(cls.objects.all()), cls.CACHE_TIMEOUT)
+
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
+        update_fields = kwargs.get('update_fields')
+        if not self.slug and (update_fields is None or 'slug' in update_fields):
+            self.slug = fast_slugify(self.name)
         super().save(*args, **kwargs)
 
 
@@ -125,6 +185,12 @@ class FortyDaysNote(TimeStampedModel):
         verbose_name = "40 Days Note"
         verbose_name_plural = "40 Days Notes"
         ordering = ['-session_date', '-created_at']
+        indexes = [
+            # List page: published notes in session order, optionally by category; featured strip
+            models.Index(fields=['is_published', '-session_date', '-created_at'], name='note_published_date_idx'),
+            models.Index(fields=['category', '-session_date'], name='note_cat_date_idx'),
+            models.Index(fields=['is_published', 'is_featured'], name='note_published_featured_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -141,29 +207,21 @@ class FortyDaysNote(TimeStampedModel):
         # Import here to avoid circular imports
         from apps.pages.models import FortyDaysConfig
         
-        # Find the 40 Days configuration for the year of this note's session date
-        # First try to find an active config for that year
-        config = FortyDaysConfig.objects.filter(
-            start_date__year=self.session_date.year,
-            is_active=True
-        ).first()
-        
-        # If no active config for that year, try any config for that year
-        if not config:
-            config = FortyDaysConfig.objects.filter(
-                start_date__year=self.session_date.year
-            ).order_by('-start_date').first()
+        # Find the 40 Days date range for the year of this note's session date
+        # (the active config for that year, otherwise the latest; cached across notes)
+        date_range = FortyDaysConfig.get_year_ranges().get(self.session_date.year)
         
-        # If still no config found, return empty string
-        if not config:
+        # If no config found for that year, return empty string
+        if not date_range:
             return ""
+        start_date, end_date = date_range
         
         # Calculate the difference in days from the config's start date
-        delta = self.session_date - config.start_date
+        delta = self.session_date - start_date
         day_number = delta.days + 1  # +1 because Day 1 is the start date itself
         
         # Calculate total days in the 40 Days period
-        total_days = (config.end_date - config.start_date).days + 1
+        total_days = (end_date - start_date).days + 1
         
         # Return day count if within the period
         if 1 <= day_number <= total_days:
@@ -173,6 +231,7 @@ class FortyDaysNote(TimeStampedModel):
             return f"Day {day_number} (outside 40 Days period)"
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
+        update_fields = kwargs.get('update_fields')
+        if not self.slug and (update_fields is None or 'slug' in update_fields):
+            self.slug = fast_slugify(self.title)
         super().save(*args, **kwargs)
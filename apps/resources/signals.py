@@ -0,0 +1,16 @@
+"""
+Signal handlers for the resources app.
+Keeps the cached category lists used by the list page filters in step with the database.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import ResourceCategory, FortyDaysNoteCategory
+
+
+@receiver([post_save, post_delete], sender=ResourceCategory)
+@receiver([post_save, post_delete], sender=FortyDaysNoteCategory)
+def clear_category_cache(sender, **kwargs):
+    """Drop the cached category list when a category is added, changed or removed."""
+    cache.delete(sender.CACHE_KEY)
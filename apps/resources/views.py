@@ -5,9 +5,38 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.views.generic import ListView, DetailView
 from django.http import FileResponse, Http404
 from django.contrib import messages
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import connection
+from django.db.models import F, Q
+from apps.core.paginator import CachedCountPaginator
 from .models import Resource, ResourceCategory, FortyDaysNote, FortyDaysNoteCategory
 
 
+# Text fields covered by ?search= (must match the index expressions in migration 0004)
+RESOURCE_SEARCH_FIELDS = ('title', 'description')
+NOTE_SEARCH_FIELDS = ('title', 'content', 'expert_name')
+
+
+def search_queryset(queryset, search, fields):
+    """
+    Filter a queryset to rows matching the search term in any of the given text fields.
+    On PostgreSQL this is an English full-text match, served by the GIN indexes added in
+    migration 0004; other databases (SQLite in development) fall back to icontains.
+    """
+    if connection.vendor == 'postgresql':
+        return queryset.annotate(
+            search_vector=SearchVector(*fields, config='english')
+        ).filter(search_vector=SearchQuery(search, config='english'))
+    query = Q()
+    for field in fields:
+        query |= Q(**{f'{field}__icontains': search})
+    return queryset.filter(query)
+
+
+# Columns rendered by the resource cards (list page and related resources)
+RESOURCE_CARD_FIELDS = ('id', 'title', 'slug', 'type', 'description', 'category__name')
+
+
 class ResourceListView(ListView):
     """
     Display a list of all resources, with filtering by category and type.
@@ -16,12 +45,15 @@ class ResourceListView(ListView):
     template_name = 'resources/list.html'
     context_object_name = 'resources'
     paginate_by = 12
+    paginator_class = CachedCountPaginator
 
     def get_queryset(self):
         """
         Get all resources, optionally filtered by category or type.
         """
-        queryset = Resource.objects.all()
+        # The list shows each resource's category name, so join it in the same query,
+        # and load only the columns the cards render
+        queryset = Resource.objects.select_related('category').only(*RESOURCE_CARD_FIELDS)
         
         # Filter by category if provided
         category_slug = self.request.GET.get('category')
@@ -36,17 +68,13 @@ class ResourceListView(ListView):
         # Search functionality
         search = self.request.GET.get('search')
         if search:
-            from django.db.models import Q
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search)
-            )
+            queryset = search_queryset(queryset, search, RESOURCE_SEARCH_FIELDS)
         
         return queryset.order_by('-created_at')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['categories'] = ResourceCategory.objects.all()
+        context['categories'] = ResourceCategory.get_cached_list()
         context['current_category'] = self.request.GET.get('category')
         context['current_type'] = self.request.GET.get('type')
         context['search_query'] = self.request.GET.get('search', '')
@@ -63,15 +91,22 @@ class ResourceDetailView(DetailView):
     slug_field = 'slug'
     slug_url_kwarg = 'slug'
 
+    def get_queryset(self):
+        return Resource.objects.select_related('category')
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Get related resources (same category)
         context['related_resources'] = Resource.objects.filter(
             category=self.object.category
-        ).exclude(id=self.object.id)[:4]
+        ).select_related('category').only(*RESOURCE_CARD_FIELDS).exclude(id=self.object.id)[:4]
         return context
 
 
+# Read size used when streaming resource downloads (FileResponse defaults to 4 KB)
+DOWNLOAD_BLOCK_SIZE = 1024 * 1024
+
+
 def download_resource(request, slug):
     """
     Handle resource downloads and increment download count.
@@ -79,22 +114,29 @@ def download_resource(request, slug):
     resource = get_object_or_404(Resource, slug=slug)
     
     if resource.file:
-        # Increment download count
-        resource.download_count += 1
-        resource.save(update_fields=['download_count'])
+        # Increment download count atomically (concurrent downloads can't lose a count)
+        Resource.objects.filter(pk=resource.pk).update(download_count=F('download_count') + 1)
         
-        # Return the file for download
-        return FileResponse(
-            resource.file.open(),
+        # Return the file for download, streamed in large blocks (audio/video files can be big);
+        # for local storage the WSGI server's file_wrapper can also sendfile() it directly
+        response = FileResponse(
+            resource.file.open('rb'),
             as_attachment=True,
             filename=resource.file.name.split('/')[-1]
         )
+        response.block_size = DOWNLOAD_BLOCK_SIZE
+        return response
     else:
         raise Http404("This resource has no file attached.")
 
 
 # ==================== 40 DAYS NOTES ====================
 
+# Columns rendered by the note cards (40 Days list and related notes)
+NOTE_CARD_FIELDS = (
+    'id', 'title', 'slug', 'banner_image', 'content', 'expert_name', 'session_date', 'category__name',
+)
+
 class FortyDaysNoteListView(ListView):
     """
     Display a list of all 40 Days notes, with filtering by category.
@@ -103,12 +145,17 @@ class FortyDaysNoteListView(ListView):
     template_name = 'resources/fortydays/list.html'
     context_object_name = 'notes'
     paginate_by = 12
+    paginator_class = CachedCountPaginator
 
     def get_queryset(self):
         """
         Get all published notes, optionally filtered by category.
         """
-        queryset = FortyDaysNote.objects.filter(is_published=True)
+        # Each card shows the note's category name, so join it in the same query,
+        # and load only the columns the cards render
+        queryset = FortyDaysNote.objects.filter(is_published=True).select_related('category').only(
+            *NOTE_CARD_FIELDS
+        )
         
         # Filter by category if provided
         category_slug = self.request.GET.get('category')
@@ -118,24 +165,19 @@ class FortyDaysNoteListView(ListView):
         # Search functionality
         search = self.request.GET.get('search')
         if search:
-            from django.db.models import Q
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(content__icontains=search) |
-                Q(expert_name__icontains=search)
-            )
+            queryset = search_queryset(queryset, search, NOTE_SEARCH_FIELDS)
         
         return queryset.order_by('-session_date', '-created_at')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['categories'] = FortyDaysNoteCategory.objects.all()
+        context['categories'] = FortyDaysNoteCategory.get_cached_list()
         context['current_category'] = self.request.GET.get('category')
         context['search_query'] = self.request.GET.get('search', '')
         context['featured_notes'] = FortyDaysNote.objects.filter(
             is_published=True,
             is_featured=True
-        )[:3]
+        ).select_related('category').only(*NOTE_CARD_FIELDS)[:3]
         return context
 
 
@@ -151,14 +193,13 @@ class FortyDaysNoteDetailView(DetailView):
 
     def get_queryset(self):
         """Only show published notes."""
-        return FortyDaysNote.objects.filter(is_published=True)
+        return FortyDaysNote.objects.filter(is_published=True).select_related('category')
 
     def get(self, request, *args, **kwargs):
         """Increment view count when note is viewed."""
         response = super().get(request, *args, **kwargs)
-        note = self.get_object()
-        note.view_count += 1
-        note.save(update_fields=['view_count'])
+        # super().get() has already loaded the note into self.object
+        FortyDaysNote.objects.filter(pk=self.object.pk).update(view_count=F('view_count') + 1)
         return response
 
     def get_context_data(self, **kwargs):
@@ -167,5 +208,5 @@ class FortyDaysNoteDetailView(DetailView):
         context['related_notes'] = FortyDaysNote.objects.filter(
             category=self.object.category,
             is_published=True
-        ).exclude(id=self.object.id)[:4]
+        ).select_related('category').only(*NOTE_CARD_FIELDS).exclude(id=self.object.id)[:4]
         return context
@@ -11,6 +11,8 @@ class SubscriberAdmin(admin.ModelAdmin):
     list_filter = ['channel', 'is_active', 'receive_daily_devotion', 'receive_special_programs', 'created_at']
     search_fields = ['email', 'phone']
     readonly_fields = ['created_at', 'updated_at']
+    # Skip the extra unfiltered COUNT(*) when a filter or search is applied
+    show_full_result_count = False
     actions = ['deactivate_subscribers', 'activate_subscribers']
 
     def deactivate_subscribers(self, request, queryset):
@@ -32,6 +34,7 @@ class ScheduledNotificationAdmin(admin.ModelAdmin):
     list_display = ['title', 'scheduled_date', 'scheduled_time', 'status', 'is_paused', 'send_to_email', 'send_to_sms', 'send_to_whatsapp', 'created_at']
     list_filter = ['status', 'is_paused', 'send_to_email', 'send_to_sms', 'send_to_whatsapp', 'scheduled_date', 'created_at']
     search_fields = ['title', 'notes']
+    show_full_result_count = False
     readonly_fields = ['created_at', 'updated_at', 'sent_at', 'email_sent_count', 'email_failed_count', 'sms_sent_count', 'sms_failed_count']
     fieldsets = (
         ('Notification Details', {
@@ -1,9 +1,10 @@
 """
 API views for subscriptions.
 """
+from django.utils import timezone
 from rest_framework import generics, status
 from rest_framework.response import Response
-from .models import Subscriber
+from .models import PHONE_SEPARATORS, Subscriber
 from .serializers import SubscribeSerializer, UnsubscribeSerializer
 
 
@@ -14,6 +15,22 @@ class SubscribeAPIView(generics.CreateAPIView):
     """
     serializer_class = SubscribeSerializer
 
+    def find_subscriber(self, channel, **lookup):
+        """Return the subscriber for this address and channel (preferring an active one), or None."""
+        return Subscriber.objects.filter(channel=channel, **lookup).order_by('-is_active').first()
+
+    def reactivate(self, subscriber, receive_daily, receive_special):
+        """
+        Reactivate an existing subscriber with new preferences in a single UPDATE.
+        The row was validated when it was created, so save()'s full_clean() is skipped.
+        """
+        Subscriber.objects.filter(pk=subscriber.pk).update(
+            is_active=True,
+            receive_daily_devotion=receive_daily,
+            receive_special_programs=receive_special,
+            updated_at=timezone.now(),
+        )
+
     def create(self, request, *args, **kwargs):
         """
         Handle subscription creation.
@@ -32,32 +49,18 @@ class SubscribeAPIView(generics.CreateAPIView):
             # Normalize email (lowercase)
             email = email.lower()
             
-            # Check if already subscribed (active)
-            existing_subscriber = Subscriber.objects.filter(
-                email=email,
-                channel=Subscriber.CHANNEL_EMAIL,
-                is_active=True
-            ).first()
+            # One lookup covers both cases below (an active row wins if there are several)
+            existing_subscriber = self.find_subscriber(Subscriber.CHANNEL_EMAIL, email=email)
             
-            if existing_subscriber:
+            if existing_subscriber and existing_subscriber.is_active:
                 return Response(
                     {'error': 'This email address is already subscribed. If you want to update your preferences, please contact us or unsubscribe first.'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Check if exists but inactive (reactivate)
-            inactive_subscriber = Subscriber.objects.filter(
-                email=email,
-                channel=Subscriber.CHANNEL_EMAIL,
-                is_active=False
-            ).first()
-            
-            if inactive_subscriber:
-                # Reactivate and update preferences
-                inactive_subscriber.is_active = True
-                inactive_subscriber.receive_daily_devotion = receive_daily
-                inactive_subscriber.receive_special_programs = receive_special
-                inactive_subscriber.save()
+            if existing_subscriber:
+                # Exists but inactive: reactivate and update preferences
+                self.reactivate(existing_subscriber, receive_daily, receive_special)
                 message = 'Your subscription has been reactivated! You will receive daily devotions via email.'
             else:
                 # Create new subscriber
@@ -72,7 +75,7 @@ class SubscribeAPIView(generics.CreateAPIView):
         
         elif channel == Subscriber.CHANNEL_SMS:
             # Normalize phone number (remove spaces and common separators)
-            phone = phone.replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
+            phone = phone.translate(PHONE_SEPARATORS)
             
             # Validate that phone number includes country code (must start with +)
             if not phone.startswith('+'):
@@ -88,32 +91,18 @@ class SubscribeAPIView(generics.CreateAPIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Check if already subscribed (active)
-            existing_subscriber = Subscriber.objects.filter(
-                phone=phone,
-                channel=Subscriber.CHANNEL_SMS,
-                is_active=True
-            ).first()
+            # One lookup covers both cases below (an active row wins if there are several)
+            existing_subscriber = self.find_subscriber(Subscriber.CHANNEL_SMS, phone=phone)
             
-            if existing_subscriber:
+            if existing_subscriber and existing_subscriber.is_active:
                 return Response(
                     {'error': 'This phone number is already subscribed. If you want to update your preferences, please contact us or unsubscribe first.'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Check if exists but inactive (reactivate)
-            inactive_subscriber = Subscriber.objects.filter(
-                phone=phone,
-                channel=Subscriber.CHANNEL_SMS,
-                is_active=False
-            ).first()
-            
-            if inactive_subscriber:
-                # Reactivate and update preferences
-                inactive_subscriber.is_active = True
-                inactive_subscriber.receive_daily_devotion = receive_daily
-                inactive_subscriber.receive_special_programs = receive_special
-                inactive_subscriber.save()
+            if existing_subscriber:
+                # Exists but inactive: reactivate and update preferences
+                self.reactivate(existing_subscriber, receive_daily, receive_special)
                 message = 'Your subscription has been reactivated! You will receive daily devotions via SMS.'
             else:
                 # Create new subscriber
@@ -128,7 +117,7 @@ class SubscribeAPIView(generics.CreateAPIView):
         
         elif channel == Subscriber.CHANNEL_WHATSAPP:
             # Normalize phone number (remove spaces and common separators)
-            phone = phone.replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
+            phone = phone.translate(PHONE_SEPARATORS)
             
             # Validate that phone number includes country code (must start with +)
             if not phone.startswith('+'):
@@ -144,32 +133,18 @@ class SubscribeAPIView(generics.CreateAPIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Check if already subscribed (active)
-            existing_subscriber = Subscriber.objects.filter(
-                phone=phone,
-                channel=Subscriber.CHANNEL_WHATSAPP,
-                is_active=True
-            ).first()
+            # One lookup covers both cases below (an active row wins if there are several)
+            existing_subscriber = self.find_subscriber(Subscriber.CHANNEL_WHATSAPP, phone=phone)
             
-            if existing_subscriber:
+            if existing_subscriber and existing_subscriber.is_active:
                 return Response(
                     {'error': 'This phone number is already subscribed. If you want to update your preferences, please contact us or unsubscribe first.'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Check if exists but inactive (reactivate)
-            inactive_subscriber = Subscriber.objects.filter(
-                phone=phone,
-                channel=Subscriber.CHANNEL_WHATSAPP,
-                is_active=False
-            ).first()
-            
-            if inactive_subscriber:
-                # Reactivate and update preferences
-                inactive_subscriber.is_active = True
-                inactive_subscriber.receive_daily_devotion = receive_daily
-                inactive_subscriber.receive_special_programs = receive_special
-                inactive_subscriber.save()
+            if existing_subscriber:
+                # Exists but inactive: reactivate and update preferences
+                self.reactivate(existing_subscriber, receive_daily, receive_special)
                 message = 'Your subscription has been reactivated! You will receive daily devotions via WhatsApp.'
             else:
                 # Create new subscriber
@@ -204,13 +179,12 @@ class UnsubscribeAPIView(generics.CreateAPIView):
         phone = data.get('phone', '').strip()
 
         if email:
-            subscriber = Subscriber.objects.filter(
+            # A single UPDATE; its row count tells us whether the address was found
+            updated = Subscriber.objects.filter(
                 email=email,
                 channel=Subscriber.CHANNEL_EMAIL
-            ).first()
-            if subscriber:
-                subscriber.is_active = False
-                subscriber.save()
+            ).update(is_active=False, updated_at=timezone.now())
+            if updated:
                 return Response({'message': 'Successfully unsubscribed from email notifications.'}, 
                              status=status.HTTP_200_OK)
             else:
@@ -218,17 +192,17 @@ class UnsubscribeAPIView(generics.CreateAPIView):
                              status=status.HTTP_404_NOT_FOUND)
         
         elif phone:
-            # Try to find subscriber by phone (could be SMS or WhatsApp)
+            # Try to find subscriber by phone (could be SMS or WhatsApp); only the id and
+            # channel are needed to deactivate it and word the reply
             subscriber = Subscriber.objects.filter(
                 phone=phone
-            ).first()
+            ).values_list('pk', 'channel').first()
             if subscriber:
-                subscriber.is_active = False
-                subscriber.save()
-                channel_name = "SMS" if subscriber.channel == Subscriber.CHANNEL_SMS else "WhatsApp"
+                subscriber_pk, channel = subscriber
+                Subscriber.objects.filter(pk=subscriber_pk).update(is_active=False, updated_at=timezone.now())
+                channel_name = "SMS" if channel == Subscriber.CHANNEL_SMS else "WhatsApp"
                 return Response({'message': f'Successfully unsubscribed from {channel_name} notifications.'}, 
                              status=status.HTTP_200_OK)
             else:
                 return Response({'error': 'Phone number not found.'}, 
                              status=status.HTTP_404_NOT_FOUND)
-
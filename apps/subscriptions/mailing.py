@@ -0,0 +1,175 @@
+"""
+Bulk email sending for devotions and scheduled notifications.
+"""
+import smtplib
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.smtp import EmailBackend as SMTPEmailBackend
+from django.utils.module_loading import import_string
+
+# Transient SMTP failures (4xx replies, or a connection dropped before the message body
+# was sent) are retried with exponential backoff; anything else (e.g. a refused address,
+# or a drop after DATA that may already have delivered) fails straight away
+SEND_ATTEMPTS = 3
+RETRY_BACKOFF = 1  # seconds before the first retry, doubled for each one after
+
+# Concurrent SMTP sessions used by send_bulk_email() when settings.EMAIL_SEND_WORKERS
+# is not set; Gmail-style providers throttle or drop accounts that open many at once
+DEFAULT_SEND_WORKERS = 2
+SEND_BATCH_PER_WORKER = 50
+
+# How often (in sent messages) bulk senders report progress
+PROGRESS_EVERY = 500
+
+
+class _DataTrackingMixin:
+    """Remember whether the current message got as far as the DATA command."""
+    data_started = False
+
+    def mail(self, *args, **kwargs):
+        self.data_started = False
+        return super().mail(*args, **kwargs)
+
+    def data(self, msg):
+        self.data_started = True
+        return super().data(msg)
+
+
+class _DataTrackingSMTP(_DataTrackingMixin, smtplib.SMTP):
+    pass
+
+
+class _DataTrackingSMTP_SSL(_DataTrackingMixin, smtplib.SMTP_SSL):
+    pass
+
+
+class _DataTrackingEmailBackend(SMTPEmailBackend):
+    """
+    SMTP backend whose sessions record whether the message body was sent, so a
+    dropped connection can be told apart from one that may already have delivered.
+    """
+
+    @property
+    def connection_class(self):
+        return _DataTrackingSMTP_SSL if self.use_ssl else _DataTrackingSMTP
+
+
+def _get_connection():
+    """Open-able connection for bulk sends; SMTP sessions track the DATA phase."""
+    if issubclass(import_string(settings.EMAIL_BACKEND), SMTPEmailBackend):
+        return _DataTrackingEmailBackend(fail_silently=False)
+    return get_connection(fail_silently=False)
+
+
+def _is_transient(error, connection):
+    """Return True if a send failure is worth retrying without risking a duplicate."""
+    if isinstance(error, smtplib.SMTPResponseException):
+        # A 4xx reply (to the connect, MAIL, RCPT or DATA) means the server did not take the message
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, (smtplib.SMTPServerDisconnected, socket.timeout, ConnectionError)):
+        # No session means the connect itself failed. Once DATA has started the server
+        # may have accepted the message before the connection dropped, so resending
+        # could deliver it twice
+        session = getattr(connection, 'connection', None)
+        return session is None or not getattr(session, 'data_started', True)
+    return False
+
+
+def _reconnect(connection):
+    """Drop a broken SMTP session and open a fresh one for the next attempt."""
+    try:
+        connection.close()
+    except Exception:
+        pass
+    try:
+        connection.open()
+    except Exception:
+        # The retried send opens (and reports) the connection itself
+        pass
+
+
+def _send_with_retry(email_message):
+    """Send one message, retrying transient SMTP failures."""
+    for attempt in range(SEND_ATTEMPTS):
+        try:
+            return email_message.send()
+        except Exception as e:
+            if attempt == SEND_ATTEMPTS - 1 or not _is_transient(e, email_message.connection):
+                raise
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+            _reconnect(email_message.connection)
+
+
+def send_bulk_email(subject, message, recipients, progress=None, workers=None):
+    """
+    Send the same message to each recipient address individually.
+
+    Sending is I/O-bound, so a small pool of threads overlaps the SMTP round trips.
+    Each thread keeps its own SMTP connection for the whole run rather than opening
+    one (and doing a TLS handshake) per email. Recipients are consumed in batches,
+    so a streamed queryset is never loaded all at once.
+
+    Args:
+        subject: Email subject
+        message: Plain-text body (rendered once by the caller)
+        recipients: Iterable of email addresses
+        progress: Optional callable, called with the running sent count every PROGRESS_EVERY emails
+        workers: Number of sending threads (each holds one SMTP connection);
+            defaults to settings.EMAIL_SEND_WORKERS
+
+    Returns:
+        tuple: (sent_count, errors) where errors maps each error message to the
+        list of addresses that failed with it
+    """
+    from_email = getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@upliftyourmorning.com')
+    if workers is None:
+        workers = getattr(settings, 'EMAIL_SEND_WORKERS', DEFAULT_SEND_WORKERS)
+    sent_count = 0
+    errors = {}
+    local = threading.local()
+    connections = []
+    connections_lock = threading.Lock()
+
+    def send_one(email):
+        connection = getattr(local, 'connection', None)
+        if connection is None:
+            connection = local.connection = _get_connection()
+            with connections_lock:
+                connections.append(connection)
+            try:
+                connection.open()
+            except Exception:
+                # Each send retries the connection and records its own failure
+                pass
+        _send_with_retry(EmailMessage(subject, message, from_email, [email], connection=connection))
+
+    recipients = iter(recipients)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                batch = list(islice(recipients, workers * SEND_BATCH_PER_WORKER))
+                if not batch:
+                    break
+                futures = {executor.submit(send_one, email): email for email in batch}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        sent_count += 1
+                        if progress and sent_count % PROGRESS_EVERY == 0:
+                            progress(sent_count)
+                    except Exception as e:
+                        # Group errors by message so large failures can be summarised
+                        errors.setdefault(str(e), []).append(futures[future])
+    finally:
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception:
+                pass
+    return sent_count, errors
@@ -6,16 +6,21 @@ Usage:
     python manage.py send_daily_devotions
 """
 from django.core.management.base import BaseCommand
-from django.core.mail import send_mail
 from django.conf import settings
 from django.utils import timezone
 from datetime import date
 from apps.subscriptions.models import Subscriber, ScheduledNotification
 from apps.devotions.models import Devotion
+from apps.subscriptions.mailing import PROGRESS_EVERY, send_bulk_email
 from decouple import config
 import requests
 from django.utils import timezone
 
+# Devotion columns read by the email, SMS and WhatsApp message builders
+DEVOTION_MESSAGE_FIELDS = (
+    'id', 'title', 'image', 'scripture_reference', 'passage_text', 'body', 'reflection', 'prayer', 'action_point',
+)
+
 
 class Command(BaseCommand):
     help = 'Send today\'s daily devotion to all active subscribers'
@@ -50,7 +55,7 @@ class Command(BaseCommand):
             devotion = Devotion.objects.filter(
                 is_published=True,
                 publish_date=today
-            ).first()
+            ).only(*DEVOTION_MESSAGE_FIELDS).first()
             
             if not devotion:
                 if force:
@@ -72,38 +77,33 @@ class Command(BaseCommand):
             channel=Subscriber.CHANNEL_EMAIL,
             is_active=True,
             receive_daily_devotion=True,
-            email__isnull=False
-        ).exclude(email='')
+            email__gt=''
+        )
         
         # Get active WhatsApp subscribers who want daily devotions
         sms_subscribers = Subscriber.objects.filter(
             channel=Subscriber.CHANNEL_SMS,
             is_active=True,
-            phone__isnull=False
-        ).exclude(phone='')
+            phone__gt=''
+        )
         
         whatsapp_subscribers = Subscriber.objects.filter(
             channel=Subscriber.CHANNEL_WHATSAPP,
             is_active=True,
             receive_daily_devotion=True,
-            phone__isnull=False
-        ).exclude(phone='')
-        
-        total_email = email_subscribers.count()
-        total_sms = sms_subscribers.count()
-        total_whatsapp = whatsapp_subscribers.count()
-        total_subscribers = total_email + total_sms + total_whatsapp
-        
-        self.stdout.write(f'\nFound {total_email} active email subscribers for daily devotions')
-        self.stdout.write(f'Found {total_sms} active SMS subscribers for daily devotions')
-        self.stdout.write(f'Found {total_whatsapp} active WhatsApp subscribers for daily devotions')
-        self.stdout.write(f'Total: {total_subscribers} subscribers')
-        
-        if total_subscribers == 0:
-            self.stdout.write(self.style.WARNING('No subscribers to send to. Exiting.'))
-            return
+            phone__gt=''
+        )
         
         if dry_run:
+            # Only a dry run reports totals up front; a real run counts as it sends
+            total_email = email_subscribers.count()
+            total_sms = sms_subscribers.count()
+            total_whatsapp = whatsapp_subscribers.count()
+            
+            self.stdout.write(f'\nFound {total_email} active email subscribers for daily devotions')
+            self.stdout.write(f'Found {total_sms} active SMS subscribers for daily devotions')
+            self.stdout.write(f'Found {total_whatsapp} active WhatsApp subscribers for daily devotions')
+            self.stdout.write(f'Total: {total_email + total_sms + total_whatsapp} subscribers')
             self.stdout.write(self.style.WARNING('\nDRY RUN MODE - No messages will be sent'))
             self.stdout.write(f'Would send to {total_email} email subscribers')
             self.stdout.write(f'Would send to {total_sms} SMS subscribers')
@@ -112,6 +112,15 @@ class Command(BaseCommand):
                 self.stdout.write(f'Devotion: {devotion.title}')
             return
         
+        # EXISTS stops at the first matching row, unlike a full COUNT
+        has_email = email_subscribers.exists()
+        has_sms = sms_subscribers.exists()
+        has_whatsapp = whatsapp_subscribers.exists()
+        
+        if not (has_email or has_sms or has_whatsapp):
+            self.stdout.write(self.style.WARNING('\nNo subscribers to send to. Exiting.'))
+            return
+        
         # Prepare email content
         if devotion:
             email_subject = f'Daily Devotion - {devotion.title}'
@@ -126,67 +135,60 @@ class Command(BaseCommand):
         email_sent_count = 0
         email_failed_count = 0
         
-        if total_email > 0:
-            self.stdout.write(f'\nSending emails to {total_email} subscribers...')
+        if has_email:
+            self.stdout.write('\nSending emails to subscribers...')
             
-            for subscriber in email_subscribers:
-                try:
-                    send_mail(
-                        email_subject,
-                        email_message,
-                        settings.DEFAULT_FROM_EMAIL if hasattr(settings, 'DEFAULT_FROM_EMAIL') else 'noreply@upliftyourmorning.com',
-                        [subscriber.email],
-                        fail_silently=False,
-                    )
-                    email_sent_count += 1
-                    if email_sent_count % 10 == 0:
-                        self.stdout.write(f'  Sent to {email_sent_count} email subscribers...')
-                except Exception as e:
-                    email_failed_count += 1
-                    self.stdout.write(self.style.ERROR(
-                        f'  Failed to send to {subscriber.email}: {str(e)}'
-                    ))
+            email_sent_count, email_errors = send_bulk_email(
+                email_subject,
+                email_message,
+                email_subscribers.values_list('email', flat=True).iterator(chunk_size=1000),
+                progress=lambda sent: self.stdout.write(f'  Sent to {sent} email subscribers...'),
+            )
+            for error_msg, emails in email_errors.items():
+                email_failed_count += len(emails)
+                for email in emails:
+                    self.stdout.write(self.style.ERROR(f'  Failed to send to {email}: {error_msg}'))
         
         # Send SMS messages (via FastR API - short messages)
         sms_sent_count = 0
         sms_failed_count = 0
         
-        if total_sms > 0:
-            self.stdout.write(f'\nSending SMS to {total_sms} subscribers...')
+        if has_sms:
+            self.stdout.write('\nSending SMS to subscribers...')
             
-            for subscriber in sms_subscribers:
+            for phone in sms_subscribers.values_list('phone', flat=True).iterator(chunk_size=1000):
                 try:
-                    result = self._send_sms(subscriber.phone, sms_message)
+                    result = self._send_sms(phone, sms_message)
                     # Only count as sent if _send_sms returned True (actually sent)
                     # If False, SMS is not configured and we skip silently
                     if result is True:
                         sms_sent_count += 1
-                        if sms_sent_count % 10 == 0:
+                        if sms_sent_count % PROGRESS_EVERY == 0:
                             self.stdout.write(f'  Sent to {sms_sent_count} SMS subscribers...')
                     # If result is False, SMS not configured - skip silently (don't count as sent or failed)
                 except Exception as e:
                     sms_failed_count += 1
                     self.stdout.write(self.style.ERROR(
-                        f'  Failed to send SMS to {subscriber.phone}: {str(e)}'
+                        f'  Failed to send SMS to {phone}: {str(e)}'
                     ))
         
         # Send WhatsApp messages (via Twilio API)
         whatsapp_sent_count = 0
         whatsapp_failed_count = 0
         
-        if total_whatsapp > 0:
-            self.stdout.write(f'\nSending WhatsApp to {total_whatsapp} subscribers...')
+        if has_whatsapp:
+            self.stdout.write('\nSending WhatsApp to subscribers...')
             from apps.subscriptions.whatsapp import send_whatsapp_message
-            for subscriber in whatsapp_subscribers:
+            for phone in whatsapp_subscribers.values_list('phone', flat=True).iterator(chunk_size=1000):
                 try:
-                    send_whatsapp_message(subscriber.phone, sms_message)
+                    send_whatsapp_message(phone, sms_message)
                     whatsapp_sent_count += 1
-                    if whatsapp_sent_count % 10 == 0:
+                    if whatsapp_sent_count % PROGRESS_EVERY == 0:
                         self.stdout.write(f'  Sent to {whatsapp_sent_count} WhatsApp subscribers...')
                 except Exception as e:
                     whatsapp_failed_count += 1
                     self.stdout.write(self.style.ERROR(
-                        f'  Failed to send WhatsApp to {subscriber.phone}: {str(e)}'
+                        f'  Failed to send WhatsApp to {phone}: {str(e)}'
                     ))
         
         # Summary
@@ -213,21 +215,21 @@ class Command(BaseCommand):
         if devotion.scripture_reference:
             content_parts.append(f"Scripture: {devotion.scripture_reference}")
             if devotion.passage_text:
-                content_parts.append(f"\n{devotion.passage_text}")
+                content_parts.append(devotion.passage_text)
         
         if devotion.body:
-            content_parts.append(f"\n\n{devotion.body}")
-        
-        if devotion.reflection:
-            content_parts.append(f"\n\nReflection:\n{devotion.reflection}")
+            content_parts.append(devotion.body)
         
-        if devotion.prayer:
-            content_parts.append(f"\n\nPrayer:\n{devotion.prayer}")
+        for heading, text in (
+            ('Reflection', devotion.reflection),
+            ('Prayer', devotion.prayer),
+            ('Action Point', devotion.action_point),
+        ):
+            if text:
+                content_parts.append(f"{heading}:\n{text}")
         
-        if devotion.action_point:
-            content_parts.append(f"\n\nAction Point:\n{devotion.action_point}")
-        
-        devotion_content = "\n".join(content_parts)
+        # Sections are separated by a single blank line, joined in one pass
+        devotion_content = "\n\n".join(content_parts)
         
         message = f"""
 Good Morning!
@@ -475,7 +477,7 @@ To unsubscribe, visit: {site_url}/subscriptions/unsubscribe/
             status=ScheduledNotification.STATUS_SCHEDULED,
             is_paused=False,
             scheduled_date__lte=now.date()
-        )
+        ).select_related('devotion')
         
         # Filter by time (check if scheduled time has passed today)
         notifications_to_send = []
@@ -503,7 +505,7 @@ To unsubscribe, visit: {site_url}/subscriptions/unsubscribe/
             devotion = Devotion.objects.filter(
                 is_published=True,
                 publish_date=notification.scheduled_date
-            ).first()
+            ).only(*DEVOTION_MESSAGE_FIELDS).first()
         
         # IMPORTANT: Check if there's a fresh devotion for the scheduled date
         # If no devotion exists, skip sending (don't send placeholder)
@@ -564,31 +566,31 @@ To unsubscribe, visit: {site_url}/subscriptions/unsubscribe/
             email_qs = Subscriber.objects.filter(
                 channel=Subscriber.CHANNEL_EMAIL,
                 is_active=True,
-                email__isnull=False
-            ).exclude(email='')
+                email__gt=''
+            )
             if notification.only_daily_devotion_subscribers:
                 email_qs = email_qs.filter(receive_daily_devotion=True)
-            email_subscribers = list(email_qs)
+            email_subscribers = list(email_qs.values_list('email', flat=True))
         
         if notification.send_to_sms:
             sms_qs = Subscriber.objects.filter(
                 channel=Subscriber.CHANNEL_SMS,
                 is_active=True,
-                phone__isnull=False
-            ).exclude(phone='')
+                phone__gt=''
+            )
             if notification.only_daily_devotion_subscribers:
                 sms_qs = sms_qs.filter(receive_daily_devotion=True)
-            sms_subscribers = list(sms_qs)
+            sms_subscribers = list(sms_qs.values_list('phone', flat=True))
         
         if notification.send_to_whatsapp:
             whatsapp_qs = Subscriber.objects.filter(
                 channel=Subscriber.CHANNEL_WHATSAPP,
                 is_active=True,
-                phone__isnull=False
-            ).exclude(phone='')
+                phone__gt=''
+            )
             if notification.only_daily_devotion_subscribers:
                 whatsapp_qs = whatsapp_qs.filter(receive_daily_devotion=True)
-            whatsapp_subscribers = list(whatsapp_qs)
+            whatsapp_subscribers = list(whatsapp_qs.values_list('phone', flat=True))
         
         total_recipients = len(email_subscribers) + len(sms_subscribers) + len(whatsapp_subscribers)
         self.stdout.write(f'  Recipients: {len(email_subscribers)} email, {len(sms_subscribers)} SMS, {len(whatsapp_subscribers)} WhatsApp')
@@ -602,9 +604,6 @@ To unsubscribe, visit: {site_url}/subscriptions/unsubscribe/
         email_failed = 0
         email_errors = {}
         if email_subscribers:
-            from django.core.mail import send_mail
-            from django.conf import settings
-            
             # Check email configuration first
             if settings.EMAIL_BACKEND == 'django.core.mail.backends.console.EmailBackend':
                 self.stdout.write(self.style.WARNING(
@@ -616,23 +615,12 @@ To unsubscribe, visit: {site_url}/subscriptions/unsubscribe/
                     '  ⚠️  Email credentials not configured. Please set EMAIL_HOST_USER and EMAIL_HOST_PASSWORD in .env'
                 ))
             
-            for subscriber in email_subscribers:
-                try:
-                    send_mail(
-                        email_subject,
-                        email_message,
-                        settings.DEFAULT_FROM_EMAIL if hasattr(settings, 'DEFAULT_FROM_EMAIL') else 'noreply@upliftyourmorning.com',
-                        [subscriber.email],
-                        fail_silently=False,
-                    )
-                    email_sent += 1
-                except Exception as e:
-                    email_failed += 1
-                    error_msg = str(e)
-                    # Group errors by type
-                    if error_msg not in email_errors:
-                        email_errors[error_msg] = []
-                    email_errors[error_msg].append(subscriber.email)
+            email_sent, email_errors = send_bulk_email(
+                email_subject,
+                email_message,
+                email_subscribers,
+            )
+            email_failed = sum(len(emails) for emails in email_errors.values())
         
         # Display grouped email errors
         if email_errors:
@@ -652,9 +640,9 @@ To unsubscribe, visit: {site_url}/subscriptions/unsubscribe/
         sms_failed = 0
         sms_errors = {}
         if sms_subscribers:
-            for subscriber in sms_subscribers:
+            for phone in sms_subscribers:
                 try:
-                    result = self._send_sms(subscriber.phone, sms_message)
+                    result = self._send_sms(phone, sms_message)
                     # Only count as sent if _send_sms returned True (actually sent)
                     # If False, SMS is not configured and we skip silently
                     if result is True:
@@ -665,7 +653,7 @@ To unsubscribe, visit: {site_url}/subscriptions/unsubscribe/
                     error_msg = str(e)
                     if error_msg not in sms_errors:
                         sms_errors[error_msg] = []
-                    sms_errors[error_msg].append(subscriber.phone)
+                    sms_errors[error_msg].append(phone)
         
         # Send WhatsApp (via Twilio API - full email content)
         whatsapp_sent = 0
@@ -673,17 +661,17 @@ To unsubscribe, visit: {site_url}/subscriptions/unsubscribe/
         whatsapp_errors = {}
         if whatsapp_subscribers:
             from apps.subscriptions.whatsapp import send_whatsapp_message
-            for subscriber in whatsapp_subscribers:
+            for phone in whatsapp_subscribers:
                 try:
                     # WhatsApp gets the full devotion email content
-                    send_whatsapp_message(subscriber.phone, whatsapp_message)
+                    send_whatsapp_message(phone, whatsapp_message)
                     whatsapp_sent += 1
                 except Exception as e:
                     whatsapp_failed += 1
                     error_msg = str(e)
                     if error_msg not in whatsapp_errors:
                         whatsapp_errors[error_msg] = []
-                    whatsapp_errors[error_msg].append(subscriber.phone)
+                    whatsapp_errors[error_msg].append(phone)
         
         # Display grouped SMS errors
         if sms_errors:
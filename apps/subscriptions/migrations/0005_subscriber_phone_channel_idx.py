@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0004_alter_subscriber_channel'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='subscriber',
+            index=models.Index(condition=models.Q(('phone__isnull', False)), fields=['phone', 'channel'], name='subscriber_phone_channel_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0005_subscriber_phone_channel_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='subscriber',
+            index=models.Index(condition=models.Q(('channel', 'email'), ('email__gt', ''), ('is_active', True), ('receive_daily_devotion', True)), fields=['email'], name='subscriber_daily_email_idx'),
+        ),
+    ]
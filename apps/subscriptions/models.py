@@ -2,10 +2,14 @@
 Models for managing email and WhatsApp subscriptions.
 """
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 from apps.core.models import TimeStampedModel
 from apps.devotions.models import Devotion
 
+# Separators stripped from phone numbers in a single str.translate() pass
+PHONE_SEPARATORS = str.maketrans('', '', ' -()')
+
 
 class Subscriber(TimeStampedModel):
     """
@@ -23,13 +27,23 @@ class Subscriber(TimeStampedModel):
 
     email = models.EmailField(blank=True, null=True)
     phone = models.CharField(max_length=50, blank=True, null=True)
-    channel = models.CharField(max_length=20, choices=CHANNEL_CHOICES)
+    channel = models.CharField(max_length=20, choices=CHANNEL_CHOICES, db_index=True)
     is_active = models.BooleanField(default=True)
     receive_daily_devotion = models.BooleanField(default=True)
     receive_special_programs = models.BooleanField(default=True)
 
     class Meta:
         unique_together = ("email", "phone", "channel")
+        indexes = [
+            # Email lookups use the unique_together index (email leads); phone lookups
+            # (subscribe/unsubscribe by number) need their own, over rows that have one
+            models.Index(fields=['phone', 'channel'], name='subscriber_phone_channel_idx', condition=Q(phone__isnull=False)),
+            # The daily send reads just the addresses of active email subscribers (covering index)
+            models.Index(
+                fields=['email'], name='subscriber_daily_email_idx',
+                condition=Q(channel='email', is_active=True, receive_daily_devotion=True, email__gt=''),
+            ),
+        ]
 
     def clean(self):
         """
@@ -48,7 +62,7 @@ class Subscriber(TimeStampedModel):
                 channel_name = "SMS" if self.channel == self.CHANNEL_SMS else "WhatsApp"
                 raise ValidationError({'phone': f'Phone number is required for {channel_name} subscriptions.'})
             # Normalize phone number (remove spaces and common separators, but keep +)
-            self.phone = self.phone.replace(' ', '').replace('-', '').replace('(', '').replace(')', '').strip()
+            self.phone = self.phone.translate(PHONE_SEPARATORS).strip()
             # Validate that phone number includes country code (must start with +)
             if not self.phone.startswith('+'):
                 raise ValidationError({'phone': 'Phone number must include country code starting with + (e.g., +233 for Ghana, +1 for USA).'})
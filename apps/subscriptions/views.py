@@ -6,7 +6,7 @@ from django.contrib import messages
 from django.views.generic import TemplateView
 from django.core.validators import validate_email
 from django.core.exceptions import ValidationError
-from .models import Subscriber
+from .models import PHONE_SEPARATORS, Subscriber
 
 
 class SubscribeView(TemplateView):
@@ -93,7 +93,7 @@ class SubscribeView(TemplateView):
                     continue
                 
                 # Normalize phone number (remove spaces and common separators, but preserve +)
-                phone_normalized = phone.replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
+                phone_normalized = phone.translate(PHONE_SEPARATORS)
                 
                 # Validate that phone number includes country code (must start with +)
                 if not phone_normalized.startswith('+'):
@@ -147,7 +147,7 @@ class SubscribeView(TemplateView):
                     continue
                 
                 # Normalize phone number (remove spaces and common separators, but preserve +)
-                phone_normalized = phone.replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
+                phone_normalized = phone.translate(PHONE_SEPARATORS)
                 
                 # Validate that phone number includes country code (must start with +)
                 if not phone_normalized.startswith('+'):
@@ -243,7 +243,7 @@ def unsubscribe(request):
         elif phone:
             # Normalize phone number (remove spaces and common separators, but preserve +)
             # to match how it's stored in subscribe
-            phone_normalized = phone.replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
+            phone_normalized = phone.translate(PHONE_SEPARATORS)
             # Try to find subscriber by phone (could be SMS or WhatsApp)
             subscriber = Subscriber.objects.filter(
                 phone=phone_normalized
@@ -248,16 +248,30 @@ else:
     MEDIA_ROOT = BASE_DIR / 'media'  # Still set but won't be accessed
 
 # Caching configuration for better performance
-# Use LocMemCache for both development and production to support analytics rate limiting
+# 'default' is file-based so every web worker shares one cache: a cache.delete() after an
+# admin save (site settings, 40 Days config, categories, dashboard stats) reaches all
+# workers, not just the one that handled the save. Needs no extra service on PythonAnywhere.
+# Every file cache set() lists the cache directory to decide whether to cull, so it only
+# holds these few low-churn keys.
+# 'local' is per-process memory for high-churn keys that never need invalidating
+# (page view rate limits, per-minute home page content, paginator counts).
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': config('CACHE_LOCATION', default=str(BASE_DIR / '.django_cache')),
         'TIMEOUT': 300,  # 5 minutes
         'OPTIONS': {
             'MAX_ENTRIES': 1000
         }
-    }
+    },
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'uplift-local',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000
+        }
+    },
 }
 
 # Analytics settings
@@ -294,6 +308,11 @@ EMAIL_PORT = config('EMAIL_PORT', default=587, cast=int)
 EMAIL_USE_TLS = config('EMAIL_USE_TLS', default=True, cast=bool)
 EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
+# Seconds before an SMTP connection attempt or command gives up, so a slow mail
+# server can't hold a request open indefinitely
+EMAIL_TIMEOUT = config('EMAIL_TIMEOUT', default=10, cast=int)
+# Concurrent SMTP connections used for bulk sends (daily devotions); keep low for Gmail
+EMAIL_SEND_WORKERS = config('EMAIL_SEND_WORKERS', default=2, cast=int)
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='noreply@upliftyourmorning.com')
 
 # FastR SMS API configuration (for SMS notifications)